@@ -0,0 +1,174 @@
+"""
+Benchmark the directory name normalization engine.
+
+Generates a reproducible corpus of synthetic scene release names and reports
+throughput of Normalize.normalize_string, iterations per name, time spent in
+each normalizer, and the end-to-end cost of normalize_directories (dry run) over
+a temporary library.
+
+Usage:
+    uv run python devtools/bench_normalize.py
+    uv run python devtools/bench_normalize.py --names 20000 --dirs 2000 --min-rate 10000
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import random
+import sys
+import tempfile
+import time
+
+# Measure the engine itself, not the on-disk caches
+os.environ["TIDYFLIX_NO_CACHE"] = "1"
+
+from tidyflix.operations.normalize import (  # noqa: E402
+    Normalize,
+    NormalizeProfile,
+    normalize_directories,
+)
+
+TITLE_WORDS = [
+    "the", "a", "of", "and", "dark", "knight", "star", "wars", "return", "king",
+    "lost", "city", "night", "last", "man", "love", "story", "blade", "runner", "alien",
+    "home", "alone", "mission", "impossible", "fast", "furious", "toy", "iron", "spider",
+    "OK", "FBI", "iPhone", "McQueen", "WALL-E", "amelie", "cafe", "x",
+]  # fmt: skip
+EDITIONS = ["EXTENDED", "Limited", "proper", "REPACK", "unrated", "Directors.Cut", "IMAX"]
+RESOLUTIONS = ["720p", "1080p", "2160p", "4k", "1080i", "UHD"]
+SOURCES = ["BluRay", "bluray", "WEB-DL", "webrip", "HDTV", "BDRip", "DVDRip", "Remux", "AMZN"]
+CODECS = ["x264", "x265", "H264", "h.265", "HEVC", "AVC", "XviD", "AV1", "10bit"]
+AUDIO = ["DTS", "dts-hd.ma.5.1", "AC3", "AAC2.0", "TrueHD.7.1.Atmos", "DDP5.1", "FLAC"]
+HDR = ["HDR", "HDR10", "DV", "HDR10Plus"]
+GROUPS = ["SPARKS", "YTS.MX", "RARBG", "EVO", "FGT", "NTb", "playWEB", "TEPES", "CMRG"]
+JUNK = [
+    "[TGx]", "[rarbg]", "[EtHD]", "Rarbg.Com-", "[ www.torrentday.com ]",
+    "www.UIndex.org    -    ", "DDLValley.COOL", "[norar]", "[www.YYeTs.net]",
+]  # fmt: skip
+SEPARATORS = [".", ".", ".", " ", "_", " - ", ".-.", "  "]
+
+
+def generate_name(rng: random.Random) -> str:
+    """Build one scene-style release name with realistic noise."""
+    title = [rng.choice(TITLE_WORDS).capitalize() for _ in range(rng.randint(1, 5))]
+    if rng.random() < 0.4:
+        title = [word.lower() for word in title]
+    year = str(rng.randint(1950, 2025))
+    year = rng.choice([year, f"({year})", f"[{year}]", year])
+
+    tags: list[str] = []
+    if rng.random() < 0.2:
+        tags.append(rng.choice(EDITIONS))
+    tags.append(rng.choice(RESOLUTIONS))
+    if rng.random() < 0.3:
+        tags.append(rng.choice(HDR))
+    tags.append(rng.choice(SOURCES))
+    if rng.random() < 0.7:
+        tags.append(rng.choice(AUDIO))
+    tags.append(rng.choice(CODECS))
+    if rng.random() < 0.15:
+        # Edition terms before the year exercise TermMover
+        title.append(rng.choice(EDITIONS))
+
+    sep = rng.choice(SEPARATORS)
+    name = sep.join([*title, year, *tags])
+    name += rng.choice(["-", "-", ".", " "]) + rng.choice(GROUPS)
+    if rng.random() < 0.25:
+        name = rng.choice([name + rng.choice(JUNK), rng.choice(JUNK) + name])
+    if rng.random() < 0.1:
+        name = f"{name}[{rng.choice(GROUPS)}]"
+    if rng.random() < 0.2:
+        # Already normalized names dominate real libraries after the first run
+        name = Normalize.normalize_string(name)
+    return name
+
+
+def generate_corpus(count: int, seed: int) -> list[str]:
+    """Generate count names deterministically from seed."""
+    rng = random.Random(seed)
+    return [generate_name(rng) for _ in range(count)]
+
+
+def bench_normalize_string(names: list[str]) -> float:
+    """Return names per second for Normalize.normalize_string."""
+    Normalize.pipeline()  # Build the pipeline outside the timed region
+    started = time.perf_counter()
+    for name in names:
+        Normalize.normalize_string(name)
+    elapsed = time.perf_counter() - started
+    return len(names) / elapsed
+
+
+def bench_profile(names: list[str]) -> NormalizeProfile:
+    """Normalize names with per-normalizer timing enabled."""
+    profile = NormalizeProfile()
+    pipeline = Normalize.pipeline()
+    for name in names:
+        pipeline.trace(name, profile=profile)
+    return profile
+
+
+def bench_normalize_directories(names: list[str]) -> float:
+    """Return directories per second for a dry-run normalize_directories over a temp library."""
+    with tempfile.TemporaryDirectory(prefix="tidyflix-bench-") as library:
+        created = 0
+        for name in dict.fromkeys(names):
+            if "/" in name or not name.strip(" ."):
+                continue
+            try:
+                os.mkdir(os.path.join(library, name))
+                created += 1
+            except OSError:
+                continue
+
+        started = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            normalize_directories([library], dry_run=True)
+        elapsed = time.perf_counter() - started
+    return created / elapsed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the normalization engine.")
+    parser.add_argument("--names", type=int, default=100_000, help="Corpus size (default: 100000)")
+    parser.add_argument(
+        "--dirs",
+        type=int,
+        default=5_000,
+        help="Directories created for the normalize_directories run (default: 5000)",
+    )
+    parser.add_argument("--seed", type=int, default=1, help="Corpus random seed (default: 1)")
+    parser.add_argument(
+        "--min-rate",
+        type=float,
+        default=0.0,
+        help="Exit with status 1 if normalize_string is slower than this many names/sec",
+    )
+    args = parser.parse_args()
+
+    print(f"Generating {args.names} names (seed {args.seed})...")
+    names = generate_corpus(args.names, args.seed)
+    changed = sum(1 for name in names if Normalize.normalize_string(name) != name)
+    print(f"  {changed} of {len(names)} names change when normalized")
+
+    print("\nNormalize.normalize_string:")
+    rate = bench_normalize_string(names)
+    print(f"  {rate:,.0f} names/sec ({1e6 / rate:.1f} µs/name)")
+
+    print("\nPer-normalizer profile:")
+    for line in bench_profile(names).format_report():
+        print(f"  {line}" if line else "")
+
+    print("\nnormalize_directories (dry run):")
+    dir_rate = bench_normalize_directories(names[: args.dirs])
+    print(f"  {dir_rate:,.0f} directories/sec")
+
+    if args.min_rate and rate < args.min_rate:
+        print(f"\nFAIL: {rate:,.0f} names/sec is below --min-rate {args.min_rate:,.0f}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,152 @@
+"""
+Media file probing with a persistent cache.
+
+This module wraps pymediainfo so that the track facts needed for codec and
+subtitle detection are parsed once per media file and remembered between runs.
+Cached entries are invalidated when the file's size, mtime or inode changes.
+DirectoryProbe lists a directory once and shares its probes between all
+consumers during a scan.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Any
+
+from pymediainfo import MediaInfo
+
+from tidyflix.core.cache import PersistentCache
+from tidyflix.core.config import MEDIA_EXTENSIONS, SUBTITLE_EXTENSIONS
+
+PROBE_CACHE_VERSION = 1
+
+_probe_cache: PersistentCache | None = None
+
+
+class MediaProbe:
+    """Track facts extracted from a single media file."""
+
+    def __init__(self, video_codec: str | None, text_tracks: list[tuple[str, str]]):
+        """
+        Initialize a MediaProbe object.
+
+        Args:
+            video_codec: Codec ID (or format) of the first video track, if any
+            text_tracks: List of (language, format) for each subtitle track
+        """
+        self.video_codec: str | None = video_codec
+        self.text_tracks: list[tuple[str, str]] = text_tracks
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON-serializable representation."""
+        return {"video_codec": self.video_codec, "text_tracks": self.text_tracks}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> MediaProbe:
+        """Build a MediaProbe from the output of to_dict()."""
+        return cls(
+            data.get("video_codec"),
+            [(str(lang), str(fmt)) for lang, fmt in data.get("text_tracks", [])],
+        )
+
+
+def get_probe_cache() -> PersistentCache:
+    """Return the process-wide probe cache, opening it on first use."""
+    global _probe_cache
+    if _probe_cache is None:
+        _probe_cache = PersistentCache("probes", version=PROBE_CACHE_VERSION)
+    return _probe_cache
+
+
+def _file_signature(file_path: str) -> list[int] | None:
+    """Return (size, mtime_ns, inode) used to detect changed files."""
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return None
+    return [st.st_size, st.st_mtime_ns, st.st_ino]
+
+
+def parse_media_file(file_path: str) -> MediaProbe:
+    """Parse a media file with MediaInfo, bypassing the cache."""
+    media_info = MediaInfo.parse(file_path)
+    video_codec: str | None = None
+    text_tracks: list[tuple[str, str]] = []
+    for track in media_info.tracks:  # pyright: ignore[reportUnknownMemberType,reportUnknownVariableType]
+        if track.track_type == "Video" and video_codec is None:  # pyright: ignore[reportUnknownMemberType]
+            video_codec = str(track.codec_id or track.format or "")  # pyright: ignore[reportUnknownMemberType,reportUnknownArgumentType]
+        elif track.track_type == "Text":  # pyright: ignore[reportUnknownMemberType]
+            text_tracks.append((str(track.language or "UNK"), str(track.format or "UNK")))  # pyright: ignore[reportUnknownMemberType,reportUnknownArgumentType]
+    return MediaProbe(video_codec, text_tracks)
+
+
+def probe_media_file(file_path: str) -> MediaProbe | None:
+    """
+    Get track facts for a media file, using the persistent cache when possible.
+
+    Returns None if the file cannot be read or parsed.
+    """
+    abs_path = os.path.abspath(file_path)
+    signature = _file_signature(abs_path)
+    if signature is None:
+        return None
+
+    cache = get_probe_cache()
+    cached = cache.get(abs_path)
+    if isinstance(cached, dict) and cached.get("signature") == signature:
+        return MediaProbe.from_dict(cached["probe"])  # pyright: ignore[reportUnknownArgumentType]
+
+    try:
+        probe = parse_media_file(abs_path)
+    except Exception:
+        return None
+
+    cache.set(abs_path, {"signature": signature, "probe": probe.to_dict()})
+    return probe
+
+
+class DirectoryProbe:
+    """Single directory listing with memoized per-file media probes."""
+
+    def __init__(self, directory_path: str):
+        """
+        List the directory and classify its files.
+
+        Args:
+            directory_path: Directory containing media and subtitle files
+        """
+        self.directory_path: str = directory_path
+        self.media_files: list[str] = []
+        self.subtitle_files: list[str] = []
+        self.readable: bool = True
+        self._probes: dict[str, MediaProbe | None] = {}
+
+        try:
+            with os.scandir(directory_path) as entries:
+                for entry in entries:
+                    try:
+                        if not entry.is_file():
+                            continue
+                    except OSError:
+                        continue
+                    name_lower = entry.name.lower()
+                    if name_lower.endswith(tuple(SUBTITLE_EXTENSIONS)):
+                        self.subtitle_files.append(entry.name)
+                    elif name_lower.endswith(MEDIA_EXTENSIONS):
+                        self.media_files.append(entry.name)
+        except OSError:
+            self.readable = False
+
+    def probe(self, filename: str) -> MediaProbe | None:
+        """Return the probe for a media file in this directory, parsing it at most once."""
+        if filename not in self._probes:
+            self._probes[filename] = probe_media_file(os.path.join(self.directory_path, filename))
+        return self._probes[filename]
+
+    def first_video_codec(self) -> str | None:
+        """Return the video codec of the first readable media file, if any."""
+        for filename in self.media_files:
+            media = self.probe(filename)
+            if media is not None:
+                return media.video_codec or ""
+        return None
@@ -7,8 +7,7 @@ embedded subtitle analysis, and subtitle formatting.
 
 import os
 
-from pymediainfo import MediaInfo
-
+from tidyflix.analysis.media_probe import DirectoryProbe, MediaProbe, probe_media_file
 from tidyflix.core.config import MEDIA_EXTENSIONS, SUBTITLE_EXTENSIONS
 from tidyflix.core.models import Colors
 
@@ -41,40 +40,46 @@ def format_subtitle_entry(lang: str, format_name: str | None = None) -> str:
         return f"{Colors.BOLD_BLUE}{lang}{Colors.RESET}"
 
 
-def get_embedded_subtitles(file_path: str) -> set[str]:
-    """Extract embedded subtitle information from media files."""
+def format_embedded_subtitles(probe: MediaProbe) -> set[str]:
+    """Format the subtitle tracks of a probed media file."""
     subtitles: set[str] = set()
-    try:
-        media_info = MediaInfo.parse(file_path)
-        for track in media_info.tracks:  # pyright: ignore[reportUnknownMemberType,reportUnknownVariableType]
-            if track.track_type == "Text":  # pyright: ignore[reportUnknownMemberType,reportUnknownVariableType]
-                lang = (track.language or "UNK").upper()  # pyright: ignore[reportUnknownMemberType,reportUnknownVariableType]
-                format_name = track.format or "UNK"  # pyright: ignore[reportUnknownMemberType,reportUnknownVariableType]
-                # Omit UTF-8 as it's just encoding, not format
-                if format_name == "UTF-8":
-                    subtitles.add(format_subtitle_entry(lang))  # pyright: ignore[reportUnknownMemberType,reportUnknownArgumentType]
-                else:
-                    subtitles.add(format_subtitle_entry(lang, format_name))  # pyright: ignore[reportUnknownMemberType,reportUnknownArgumentType]
-    except Exception:
-        pass
+    for language, format_name in probe.text_tracks:
+        lang = language.upper()
+        # Omit UTF-8 as it's just encoding, not format
+        if format_name == "UTF-8":
+            subtitles.add(format_subtitle_entry(lang))
+        else:
+            subtitles.add(format_subtitle_entry(lang, format_name))
     return subtitles
 
 
-def get_directory_subtitles(directory_path: str, language_filter: list[str] | None = None) -> str:
+def get_embedded_subtitles(file_path: str) -> set[str]:
+    """Extract embedded subtitle information from media files."""
+    probe = probe_media_file(file_path)
+    if probe is None:
+        return set()
+    return format_embedded_subtitles(probe)
+
+
+def get_directory_subtitles(
+    directory_path: str,
+    language_filter: list[str] | None = None,
+    probe: DirectoryProbe | None = None,
+) -> str:
     """Get combined list of all subtitles in a directory (embedded + external)."""
     all_subtitles: set[str] = set()
 
-    try:
-        for item in os.listdir(directory_path):
-            item_path = os.path.join(directory_path, item)
-            if os.path.isfile(item_path):
-                if is_subtitle_file(item):
-                    all_subtitles.add(extract_language_from_filename(item))
-                elif is_media_file(item):
-                    all_subtitles.update(get_embedded_subtitles(item_path))
-    except Exception:
+    directory_probe = probe if probe is not None else DirectoryProbe(directory_path)
+    if not directory_probe.readable:
         return ""
 
+    for item in directory_probe.subtitle_files:
+        all_subtitles.add(extract_language_from_filename(item))
+    for item in directory_probe.media_files:
+        media = directory_probe.probe(item)
+        if media is not None:
+            all_subtitles.update(format_embedded_subtitles(media))
+
     if all_subtitles:
         # Filter subtitles by language if filter is provided
         if language_filter:
@@ -95,6 +100,35 @@ def get_directory_subtitles(directory_path: str, language_filter: list[str] | No
     return ""
 
 
+def get_subtitle_languages(
+    probe: DirectoryProbe, language_filter: list[str] | None = None
+) -> tuple[list[str], list[str]]:
+    """
+    Return the plain language codes of a directory's subtitles, without formatting.
+
+    External subtitle files without a language code, and embedded tracks without a
+    language, are reported as UNK.
+
+    Returns:
+        Sorted, de-duplicated (external, embedded) language code lists
+    """
+    external: set[str] = set()
+    embedded: set[str] = set()
+    if probe.readable:
+        for item in probe.subtitle_files:
+            external.add((extract_language_code(item) or "unk").upper())
+        for item in probe.media_files:
+            media = probe.probe(item)
+            if media is not None:
+                embedded.update(language.upper() for language, _format in media.text_tracks)
+
+    if language_filter:
+        wanted = {lang.upper() for lang in language_filter}
+        external &= wanted
+        embedded &= wanted
+    return sorted(external), sorted(embedded)
+
+
 def find_subtitle_files(directory: str, base_path: str = "") -> list[tuple[str, str]]:
     """Recursively find all subtitle files in a directory."""
     subtitle_files: list[tuple[str, str]] = []
@@ -5,127 +5,139 @@ This module handles video encoding detection, tag parsing, scoring,
 and quality assessment for movie directories.
 """
 
-import os
 import re
+from collections.abc import Iterable, Sequence
 
-from pymediainfo import MediaInfo
-
+from tidyflix.analysis.media_probe import DirectoryProbe
 from tidyflix.core.config import ENCODING_MULTIPLIERS, MAX_SIZE_SCORE, TAG_COLORS, TAG_SCORES
 from tidyflix.core.models import Colors, DirectoryInfo, Tag
 
 
-def get_video_encoding_from_files(directory_path: str) -> str | None:
-    """Use pymediainfo to detect video encoding from media files."""
-    try:
-        for item in os.listdir(directory_path):
-            item_path = os.path.join(directory_path, item)
-            if os.path.isfile(item_path) and _is_media_file_basic(item):
-                try:
-                    media_info = MediaInfo.parse(item_path)
-                    for track in media_info.tracks:  # pyright: ignore[reportUnknownMemberType,reportUnknownVariableType]
-                        if track.track_type == "Video":  # pyright: ignore[reportUnknownMemberType,reportUnknownVariableType]
-                            codec = track.codec_id or track.format or ""  # pyright: ignore[reportUnknownMemberType,reportUnknownVariableType]
-                            codec_lower = codec.lower()  # pyright: ignore[reportUnknownMemberType,reportUnknownVariableType]
-
-                            # Check for AV1
-                            if any(av1_id in codec_lower for av1_id in ["av01", "av1"]):
-                                return "AV1"
-                            # Check for H.265/HEVC
-                            elif any(
-                                h265_id in codec_lower
-                                for h265_id in ["hevc", "h265", "x265", "hev1", "hvc1"]
-                            ):
-                                return "H265"
-                            # Check for H.264/AVC
-                            elif any(
-                                h264_id in codec_lower
-                                for h264_id in ["avc", "h264", "x264", "avc1"]
-                            ):
-                                return "H264"
-
-                            # Only check the first video file found
-                            break
-                    # Only check the first media file found
-                    break
-                except Exception:
-                    continue
-    except Exception:
-        pass
+def _delimited(term: str) -> str:
+    """Pattern for a term bounded by whitespace/dots, allowed at either end of the name."""
+    return rf"(?:(?<=[\s.])|^){term}(?=[\s.])|(?<=[\s.]){term}$"
+
+
+# Release-name tag table: tag name -> pattern matched against the lower-cased name.
+# Order matters only where two patterns can match at the same position; HDR10 must
+# precede HDR so that it is reported there.
+_TAG_PATTERNS: dict[str, str] = {
+    "AV1": _delimited("av1"),
+    "H265": r"h265|x265|h\.265|x\.265",
+    "H264": r"h264|x264|h\.264|x\.264",
+    "2160p": r"2160p",
+    "4K": _delimited("4k"),
+    "1080p": r"1080p",
+    "720p": r"720p",
+    "10bit": r"10bit",
+    "HDR10": r"hdr10",
+    "HDR": r"hdr",
+    "DV": r"(?<=[\s.])dv(?=[\s.])",
+    "IMAX": r"imax",
+    "REPACK": r"repack",
+    "3D": _delimited("3d"),
+}
+
+# One zero-width alternation tried at every position of the name, so overlapping
+# tags are all found in a single scan; each match reports its tag via lastgroup
+_TAG_SCANNER = re.compile(
+    "(?="
+    + "|".join(f"(?P<T_{i}>{pattern})" for i, pattern in enumerate(_TAG_PATTERNS.values()))
+    + ")"
+)
+_TAG_BY_GROUP: dict[str, str] = {f"T_{i}": name for i, name in enumerate(_TAG_PATTERNS)}
+
+
+def scan_release_tags(name: str) -> set[str]:
+    """
+    Return the names of all quality tags present in a release name.
+
+    The name is scanned once with a precompiled pattern built from the tag
+    table. Precedence between related tags (e.g. H265 over H264) is left to the
+    caller.
+    """
+    return {
+        _TAG_BY_GROUP[match.lastgroup]  # pyright: ignore[reportArgumentType]
+        for match in _TAG_SCANNER.finditer(name.lower())
+    }
+
+
+def classify_video_codec(codec: str) -> str | None:
+    """Map a MediaInfo codec ID or format name to AV1, H265 or H264."""
+    codec_lower = codec.lower()
+
+    # Check for AV1
+    if any(av1_id in codec_lower for av1_id in ["av01", "av1"]):
+        return "AV1"
+    # Check for H.265/HEVC
+    elif any(h265_id in codec_lower for h265_id in ["hevc", "h265", "x265", "hev1", "hvc1"]):
+        return "H265"
+    # Check for H.264/AVC
+    elif any(h264_id in codec_lower for h264_id in ["avc", "h264", "x264", "avc1"]):
+        return "H264"
     return None
 
 
-def _is_media_file_basic(filename: str) -> bool:
-    """Basic check if a file is a media file - internal helper."""
-    from tidyflix.core.config import MEDIA_EXTENSIONS
-
-    return filename.lower().endswith(MEDIA_EXTENSIONS)
+def get_video_encoding_from_files(
+    directory_path: str, probe: DirectoryProbe | None = None
+) -> str | None:
+    """Use pymediainfo to detect video encoding from media files."""
+    directory_probe = probe if probe is not None else DirectoryProbe(directory_path)
+    # Only check the first video track of the first media file found
+    codec = directory_probe.first_video_codec()
+    if codec is None:
+        return None
+    return classify_video_codec(codec)
 
 
 def parse_video_tags_with_score(
-    directory_name: str, directory_path: str | None = None, size_mb: float = 0
+    directory_name: str,
+    directory_path: str | None = None,
+    size_mb: float = 0,
+    probe: DirectoryProbe | None = None,
 ) -> tuple[list[Tag], int]:
-    """Parse video tags and return tag objects and total score."""
+    """
+    Parse video tags and return tag objects and total score.
+
+    When the name carries no encoding tag, media files are inspected through
+    probe (or a fresh DirectoryProbe for directory_path) instead.
+    """
     tags: list[Tag] = []
-    name_lower = directory_name.lower()
-    encoding_detected = False
-
-    # Check for video encoding (priority: AV1 > H265 > H264)
-    # AV1 must be surrounded by space or dot
-    if re.search(r"[\s\.]av1[\s\.]|^av1[\s\.]|[\s\.]av1$", name_lower):
-        tags.append(Tag("AV1", TAG_COLORS["AV1"], score=TAG_SCORES["AV1"]))
-        encoding_detected = True
-    elif any(codec in name_lower for codec in ["h265", "x265", "h.265", "x.265"]):
-        tags.append(Tag("H265", TAG_COLORS["H265"], score=TAG_SCORES["H265"]))
-        encoding_detected = True
-    elif any(codec in name_lower for codec in ["h264", "x264", "h.264", "x.264"]):
-        tags.append(Tag("H264", TAG_COLORS["H264"], score=TAG_SCORES["H264"]))
-        encoding_detected = True
+    found = scan_release_tags(directory_name)
+
+    def add(tag_name: str) -> None:
+        tags.append(Tag(tag_name, TAG_COLORS[tag_name], score=TAG_SCORES[tag_name]))
+
+    # Video encoding (priority: AV1 > H265 > H264); AV1 must be surrounded by space or dot
+    encoding = next((tag for tag in ("AV1", "H265", "H264") if tag in found), None)
 
     # If no encoding detected from filename and directory path provided, check media files
-    if not encoding_detected and directory_path:
-        detected_encoding = get_video_encoding_from_files(directory_path)
-        if detected_encoding == "AV1":
-            tags.append(Tag("AV1", TAG_COLORS["AV1"], score=TAG_SCORES["AV1"]))
-        elif detected_encoding == "H265":
-            tags.append(Tag("H265", TAG_COLORS["H265"], score=TAG_SCORES["H265"]))
-        elif detected_encoding == "H264":
-            tags.append(Tag("H264", TAG_COLORS["H264"], score=TAG_SCORES["H264"]))
-
-    # Check for resolution (priority order: 2160p > 4K > 1080p > 720p)
-    if "2160p" in name_lower:
-        tags.append(Tag("2160p", TAG_COLORS["2160p"], score=TAG_SCORES["2160p"]))
-    elif re.search(r"[\s\.]4k[\s\.]|^4k[\s\.]|[\s\.]4k$", name_lower):
-        tags.append(Tag("4K", TAG_COLORS["4K"], score=TAG_SCORES["4K"]))
-    elif "1080p" in name_lower:
-        tags.append(Tag("1080p", TAG_COLORS["1080p"], score=TAG_SCORES["1080p"]))
-    elif "720p" in name_lower:
-        tags.append(Tag("720p", TAG_COLORS["720p"], score=TAG_SCORES["720p"]))
-
-    # Check for bit depth
-    if "10bit" in name_lower:
-        tags.append(Tag("10bit", TAG_COLORS["10bit"], score=TAG_SCORES["10bit"]))
-
-    # Check for HDR (HDR10 takes precedence over plain HDR)
-    if "hdr10" in name_lower:
-        tags.append(Tag("HDR10", TAG_COLORS["HDR10"], score=TAG_SCORES["HDR10"]))
-    elif "hdr" in name_lower:
-        tags.append(Tag("HDR", TAG_COLORS["HDR"], score=TAG_SCORES["HDR"]))
-
-    # Check for DV (Dolby Vision) with regex requiring space or dot before and after
-    if re.search(r"[\s\.]dv[\s\.]", name_lower):
-        tags.append(Tag("DV", TAG_COLORS["DV"], score=TAG_SCORES["DV"]))
-
-    # Check for IMAX
-    if "imax" in name_lower:
-        tags.append(Tag("IMAX", TAG_COLORS["IMAX"], score=TAG_SCORES["IMAX"]))
-
-    # Check for REPACK
-    if "repack" in name_lower:
-        tags.append(Tag("REPACK", TAG_COLORS["REPACK"], score=TAG_SCORES["REPACK"]))
-
-    # Check for 3D (must be surrounded by space or dot)
-    if re.search(r"[\s\.]3d[\s\.]|^3d[\s\.]|[\s\.]3d$", name_lower):
-        tags.append(Tag("3D", TAG_COLORS["3D"], score=TAG_SCORES["3D"]))
+    if encoding is None and probe is None and directory_path:
+        probe = DirectoryProbe(directory_path)
+    if encoding is None and probe is not None:
+        encoding = get_video_encoding_from_files(probe.directory_path, probe)
+    if encoding is not None:
+        add(encoding)
+
+    # Resolution (priority order: 2160p > 4K > 1080p > 720p)
+    resolution = next((tag for tag in ("2160p", "4K", "1080p", "720p") if tag in found), None)
+    if resolution is not None:
+        add(resolution)
+
+    # Bit depth
+    if "10bit" in found:
+        add("10bit")
+
+    # HDR (HDR10 takes precedence over plain HDR)
+    if "HDR10" in found:
+        add("HDR10")
+    elif "HDR" in found:
+        add("HDR")
+
+    # DV (Dolby Vision), IMAX, REPACK and 3D
+    for tag_name in ("DV", "IMAX", "REPACK", "3D"):
+        if tag_name in found:
+            add(tag_name)
 
     # Calculate tag-based score
     tag_score = sum(tag.score for tag in tags)
@@ -169,43 +181,74 @@ def calculate_adjusted_size(size_mb: float, tags: list[Tag]) -> float:
     return adjusted_size_mb
 
 
+class GroupScores:
+    """Scores of the directories in one duplicate group, in input order."""
+
+    def __init__(self, scores: list[int | None], deltas: list[int], ranking: list[int]):
+        """
+        Initialize a GroupScores object.
+
+        Args:
+            scores: Tag score plus relative size score of each directory
+            deltas: Score above the lowest score in the group (0 for the lowest)
+            ranking: Directory indices ordered best first, ties in input order
+        """
+        self.scores: list[int | None] = scores
+        self.deltas: list[int] = deltas
+        self.ranking: list[int] = ranking
+
+
+def score_group(
+    adjusted_sizes: Sequence[float | None],
+    tag_scores: Sequence[int | None],
+    max_size_score: int = MAX_SIZE_SCORE,
+) -> GroupScores:
+    """
+    Score one group from its adjusted sizes and tag scores.
+
+    The largest adjusted size in the group earns max_size_score and the others a
+    proportional share. Directories without a known size keep their tag score.
+    """
+    max_adjusted_size = max((size for size in adjusted_sizes if size is not None), default=0.0)
+
+    scores: list[int | None] = list(tag_scores)
+    if max_adjusted_size > 0:
+        for i, size in enumerate(adjusted_sizes):
+            if size is not None and size > 0:
+                size_score = int(size / max_adjusted_size * max_size_score)
+                tag_score = tag_scores[i]
+                scores[i] = size_score if tag_score is None else tag_score + size_score
+
+    known = [score for score in scores if score is not None]
+    baseline = min(known, default=0)
+    deltas = [score - baseline if score is not None else 0 for score in scores]
+    # sorted() is stable, so equal scores keep their discovery order
+    ranking = sorted(range(len(scores)), key=lambda i: -(scores[i] or 0))
+    return GroupScores(scores, deltas, ranking)
+
+
+def score_groups(
+    groups: Iterable[Sequence[DirectoryInfo]], max_size_score: int = MAX_SIZE_SCORE
+) -> list[GroupScores]:
+    """Score many duplicate groups in one pass without modifying the directories."""
+    return [
+        score_group(
+            [dir_info.adjusted_size_mb for dir_info in directories],
+            [dir_info.tag_score for dir_info in directories],
+            max_size_score,
+        )
+        for directories in groups
+    ]
+
+
 def calculate_relative_size_scores(
     directories: list[DirectoryInfo], max_size_score: int = MAX_SIZE_SCORE
-) -> None:
-    """Calculate relative size scores within a group of directories."""
-    if not directories:
-        return
-
-    # Find the maximum adjusted size in the group
-    max_adjusted_size = max(
-        dir_info.adjusted_size_mb
-        for dir_info in directories
-        if dir_info.adjusted_size_mb is not None
-    )
-
-    if max_adjusted_size <= 0:
-        return
-
-    # Calculate relative scores based on the largest file in the group
-    for dir_info in directories:
-        if dir_info.adjusted_size_mb is not None and dir_info.adjusted_size_mb > 0:
-            # Calculate proportional score (largest gets full points, others get proportional)
-            ratio = dir_info.adjusted_size_mb / max_adjusted_size
-            size_score = int(ratio * max_size_score)
-
-            # Update the total video score by adding the size score
-            # Remove any previous size scoring and add the new relative score
-            if dir_info.video_score is not None:
-                # Extract tag score (video_score currently includes old size scoring)
-                # We need to recalculate from just the tags
-                _, tag_score_only = parse_video_tags_with_score(
-                    dir_info.name,
-                    dir_info.abs_path,
-                    size_mb=0,  # Don't include size in this calculation
-                )
-                dir_info.video_score = tag_score_only + size_score
-            else:
-                dir_info.video_score = size_score
+) -> GroupScores:
+    """Calculate relative size scores within a group and store them as video_score."""
+    group_scores = score_groups([directories], max_size_score)[0]
+    for dir_info, score in zip(directories, group_scores.scores, strict=True):
+        dir_info.video_score = score
+    return group_scores
 
 
 def format_video_tags(tags: list[Tag]) -> str:
@@ -0,0 +1,165 @@
+"""
+Persistent on-disk caches.
+
+This module provides a small SQLite-backed key/value store kept under the
+XDG cache directory, used to remember expensive results between runs.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import sqlite3
+import threading
+from typing import Any
+
+from tidyflix.core.config import CACHE_DIR_NAME, CACHE_DISABLE_ENV, CACHE_FLUSH_THRESHOLD
+
+
+def get_cache_dir() -> str:
+    """Return the tidyflix cache directory, honoring $XDG_CACHE_HOME."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, CACHE_DIR_NAME)
+
+
+def is_cache_enabled() -> bool:
+    """Check whether on-disk caching is enabled for this process."""
+    return not os.environ.get(CACHE_DISABLE_ENV)
+
+
+class PersistentCache:
+    """
+    SQLite-backed key/value store for JSON-serializable values.
+
+    Each namespace lives in its own database file. Writes are buffered and
+    committed in batches (and at interpreter exit). When the stored version of
+    a namespace differs from the requested one, all its entries are dropped.
+    Any database error silently disables the cache so callers can always fall
+    back to recomputing.
+    """
+
+    def __init__(self, namespace: str, version: int | str = 1, directory: str | None = None):
+        """
+        Open (or create) a cache namespace.
+
+        Args:
+            namespace: Name of the cache, also used as the database file name
+            version: Format version; entries written with another version are discarded
+            directory: Directory holding the database (default: get_cache_dir())
+        """
+        self.namespace: str = namespace
+        self.version: str = str(version)
+        self._lock: threading.Lock = threading.Lock()
+        self._pending: dict[str, str | None] = {}
+        self._conn: sqlite3.Connection | None = None
+
+        if not is_cache_enabled():
+            return
+
+        db_dir = directory if directory is not None else get_cache_dir()
+        try:
+            os.makedirs(db_dir, exist_ok=True)
+            conn = sqlite3.connect(
+                os.path.join(db_dir, f"{namespace}.sqlite3"),
+                timeout=5.0,
+                check_same_thread=False,
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT)")
+            conn.execute("CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, value TEXT)")
+            row = conn.execute("SELECT value FROM meta WHERE name = 'version'").fetchone()
+            if row is None or row[0] != self.version:
+                conn.execute("DELETE FROM entries")
+                conn.execute(
+                    "INSERT OR REPLACE INTO meta (name, value) VALUES ('version', ?)",
+                    (self.version,),
+                )
+            conn.commit()
+        except (OSError, sqlite3.Error):
+            return
+
+        self._conn = conn
+        atexit.register(self.close)
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache is backed by an open database."""
+        return self._conn is not None
+
+    def get(self, key: str) -> Any | None:
+        """Return the stored value for key, or None if missing."""
+        if self._conn is None:
+            return None
+        with self._lock:
+            if key in self._pending:
+                raw = self._pending[key]
+            else:
+                try:
+                    row = self._conn.execute(
+                        "SELECT value FROM entries WHERE key = ?", (key,)
+                    ).fetchone()
+                except sqlite3.Error:
+                    return None
+                raw = row[0] if row else None
+        if raw is None:
+            return None
+        try:
+            return json.loads(raw)
+        except ValueError:
+            return None
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a JSON-serializable value under key."""
+        if self._conn is None:
+            return
+        with self._lock:
+            self._pending[key] = json.dumps(value, separators=(",", ":"))
+            if len(self._pending) >= CACHE_FLUSH_THRESHOLD:
+                self._flush_locked()
+
+    def delete(self, key: str) -> None:
+        """Remove key from the cache."""
+        if self._conn is None:
+            return
+        with self._lock:
+            self._pending[key] = None
+            if len(self._pending) >= CACHE_FLUSH_THRESHOLD:
+                self._flush_locked()
+
+    def flush(self) -> None:
+        """Commit buffered writes to disk."""
+        if self._conn is None:
+            return
+        with self._lock:
+            self._flush_locked()
+
+    def close(self) -> None:
+        """Flush pending writes and close the database."""
+        if self._conn is None:
+            return
+        with self._lock:
+            self._flush_locked()
+            try:
+                self._conn.close()
+            except sqlite3.Error:
+                pass
+            self._conn = None
+
+    def _flush_locked(self) -> None:
+        """Write pending entries; caller must hold the lock."""
+        if not self._pending or self._conn is None:
+            return
+        updates = [(k, v) for k, v in self._pending.items() if v is not None]
+        deletes = [(k,) for k, v in self._pending.items() if v is None]
+        self._pending.clear()
+        try:
+            if updates:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO entries (key, value) VALUES (?, ?)", updates
+                )
+            if deletes:
+                self._conn.executemany("DELETE FROM entries WHERE key = ?", deletes)
+            self._conn.commit()
+        except sqlite3.Error:
+            pass
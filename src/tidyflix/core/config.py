@@ -77,3 +77,26 @@ TAG_COLORS = {
 # Default values
 DEFAULT_DIRECTORY = "."
 DEFAULT_INDENT = "   "
+
+# Parallelism
+DEFAULT_SCAN_JOBS = 4  # Directories scanned concurrently during duplicate analysis
+DEFAULT_SCAN_LOOKAHEAD = 16  # Groups after the one on screen that may be scanned early
+DEFAULT_WALK_WORKERS = 8  # Directories listed concurrently when sizing a tree
+DEFAULT_VERIFY_JOBS = 4  # Subdirectories classified concurrently by verify
+DEFAULT_DELETE_JOBS = 4  # Directory trees removed concurrently after duplicate selection
+
+# Normalization engine
+NORMALIZE_MEMO_SIZE = 65536  # Normalized names remembered in memory per run
+NORMALIZE_BATCH_CHUNK = 512  # Names sent to a worker process at a time by normalize_many
+
+# Duplicate handling
+REPORT_FORMATS = ("json", "csv", "ndjson")  # Output formats of the duplicate --report mode
+KEEP_RULES = ("score", "size", "source")  # Rules available to the duplicate --keep mode
+DEFAULT_KEEP_RULES = ("score", "size", "source")  # Rule order used by a bare --keep
+TRASH_DIR_NAME = ".tidyflix-trash"  # Created in a library root by --trash, emptied by purge
+
+# Persistent cache settings
+CACHE_DIR_NAME = "tidyflix"  # Subdirectory under $XDG_CACHE_HOME (default: ~/.cache)
+CACHE_DISABLE_ENV = "TIDYFLIX_NO_CACHE"  # Set to any non-empty value to disable on-disk caches
+CACHE_FLUSH_THRESHOLD = 256  # Pending writes buffered before committing to disk
+LIBRARY_INDEX_MEMO_SIZE = 4096  # Directory listings kept in memory, least recently used dropped
@@ -0,0 +1,318 @@
+"""
+Persistent library index.
+
+This module caches directory listings (entry names and entry types) keyed by each
+directory's mtime, so repeated runs over a library only re-read directories whose
+contents changed. All tree walks in tidyflix go through it.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from collections.abc import Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+
+from tidyflix.core.cache import PersistentCache
+from tidyflix.core.config import DEFAULT_WALK_WORKERS, LIBRARY_INDEX_MEMO_SIZE, TRASH_DIR_NAME
+
+INDEX_CACHE_VERSION = 2
+
+# Entry kinds stored in a listing
+KIND_DIR = "d"  # Real directory, walked into
+KIND_DIR_LINK = "D"  # Symlink to a directory, listed but never walked into
+KIND_FILE = "f"  # Regular file, size recorded
+KIND_OTHER = "o"  # Anything else (symlink to a file, broken link, socket, ...)
+
+# Listings of directories modified this recently are not cached: filesystems with
+# coarse mtime resolution could otherwise hide a change made in the same tick.
+_RACY_WINDOW_NS = 2_000_000_000
+
+_library_index: LibraryIndex | None = None
+
+
+class DirectoryListing:
+    """Contents of a single directory as recorded in the index."""
+
+    def __init__(self, path: str, mtime_ns: int, entries: list[tuple[str, str, int]]):
+        """
+        Initialize a DirectoryListing object.
+
+        Args:
+            path: Absolute path of the directory
+            mtime_ns: Directory mtime the listing was taken at
+            entries: List of (name, kind, size) tuples; size is 0 for non-files
+        """
+        self.path: str = path
+        self.mtime_ns: int = mtime_ns
+        self.entries: list[tuple[str, str, int]] = entries
+
+    @property
+    def dirs(self) -> list[str]:
+        """
+        Names of subdirectories, including symlinks to directories (as in os.walk).
+
+        The tidyflix trash directory is left out, so directories moved to the
+        trash are invisible to every command until they are purged.
+        """
+        return [
+            name
+            for name, kind, _ in self.entries
+            if kind in (KIND_DIR, KIND_DIR_LINK) and name != TRASH_DIR_NAME
+        ]
+
+    @property
+    def files(self) -> list[str]:
+        """Names of non-directory entries (as in os.walk)."""
+        return [name for name, kind, _ in self.entries if kind in (KIND_FILE, KIND_OTHER)]
+
+    @property
+    def file_size(self) -> int:
+        """Total size of the regular files directly in this directory."""
+        return sum(size for _, kind, size in self.entries if kind == KIND_FILE)
+
+
+class DirectoryStats:
+    """Totals for a directory tree."""
+
+    def __init__(self, size: int = 0, file_count: int = 0, dir_count: int = 0):
+        """
+        Initialize a DirectoryStats object.
+
+        Args:
+            size: Total size of regular files in bytes
+            file_count: Number of non-directory entries (as counted by os.walk)
+            dir_count: Number of subdirectories, including symlinks to directories
+        """
+        self.size: int = size
+        self.file_count: int = file_count
+        self.dir_count: int = dir_count
+
+    def add(self, listing: DirectoryListing) -> None:
+        """Add the entries of a single directory listing to the totals."""
+        for _name, kind, size in listing.entries:
+            if kind in (KIND_DIR, KIND_DIR_LINK):
+                self.dir_count += 1
+            else:
+                self.file_count += 1
+                self.size += size
+
+
+def _read_entries(path: str) -> list[tuple[str, str, int]]:
+    """List a directory from disk, classifying entries without following symlinks."""
+    entries: list[tuple[str, str, int]] = []
+    with os.scandir(path) as it:
+        for entry in it:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    entries.append((entry.name, KIND_DIR, 0))
+                elif entry.is_file(follow_symlinks=False):
+                    entries.append(
+                        (entry.name, KIND_FILE, entry.stat(follow_symlinks=False).st_size)
+                    )
+                elif entry.is_symlink() and entry.is_dir():
+                    entries.append((entry.name, KIND_DIR_LINK, 0))
+                else:
+                    entries.append((entry.name, KIND_OTHER, 0))
+            except OSError:
+                entries.append((entry.name, KIND_OTHER, 0))
+    return entries
+
+
+def _restat_entries(path: str, stored: list[list[str]]) -> list[tuple[str, str, int]] | None:
+    """
+    Rebuild a persisted listing, reading the current size of each regular file.
+
+    Returns None if a file can no longer be stat'ed, so the directory is re-read.
+    """
+    entries: list[tuple[str, str, int]] = []
+    for name, kind in stored:
+        size = 0
+        if kind == KIND_FILE:
+            try:
+                size = os.stat(os.path.join(path, name), follow_symlinks=False).st_size
+            except OSError:
+                return None
+        entries.append((str(name), str(kind), size))
+    return entries
+
+
+class LibraryIndex:
+    """
+    Directory listings cached in memory and on disk, validated by directory mtime.
+
+    A directory's mtime changes whenever an entry is added, removed or renamed in
+    it, so a stat of the directory is enough to tell whether the cached names and
+    kinds are still valid. Appending to or rewriting a file does not change that
+    mtime, so file sizes are never persisted: regular files in a listing loaded
+    from disk are stat'ed again, and only the classification of entries is saved.
+
+    At most memo_size listings are kept in memory, least recently used first out,
+    so walking a large library does not hold every directory's entries at once.
+    """
+
+    def __init__(
+        self, cache: PersistentCache | None = None, memo_size: int = LIBRARY_INDEX_MEMO_SIZE
+    ):
+        self._cache: PersistentCache | None = cache
+        self._memo_size: int = max(1, memo_size)
+        self._memory: OrderedDict[str, DirectoryListing] = OrderedDict()
+        self._lock: threading.Lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+
+    def listing(self, path: str) -> DirectoryListing | None:
+        """Return the listing of a directory, or None if it cannot be read."""
+        try:
+            return self.read_listing(path)
+        except OSError:
+            return None
+
+    def read_listing(self, path: str) -> DirectoryListing:
+        """
+        Return the listing of a directory.
+
+        Raises:
+            OSError: If the directory cannot be read
+        """
+        abs_path = os.path.abspath(path)
+        try:
+            mtime_ns = os.stat(abs_path).st_mtime_ns
+        except OSError:
+            self.forget(abs_path)
+            raise
+
+        with self._lock:
+            cached = self._memory.get(abs_path)
+            if cached is not None:
+                self._memory.move_to_end(abs_path)
+        if cached is not None and cached.mtime_ns == mtime_ns:
+            return cached
+
+        if self._cache is not None:
+            stored = self._cache.get(abs_path)
+            if isinstance(stored, dict) and stored.get("mtime") == mtime_ns:
+                entries = _restat_entries(abs_path, stored["entries"])  # pyright: ignore[reportUnknownArgumentType]
+                if entries is not None:
+                    listing = DirectoryListing(abs_path, mtime_ns, entries)
+                    self._remember(listing)
+                    return listing
+
+        entries = _read_entries(abs_path)
+        listing = DirectoryListing(abs_path, mtime_ns, entries)
+        if time.time_ns() - mtime_ns > _RACY_WINDOW_NS:
+            self._remember(listing)
+            if self._cache is not None:
+                self._cache.set(
+                    abs_path,
+                    {"mtime": mtime_ns, "entries": [[name, kind] for name, kind, _ in entries]},
+                )
+        return listing
+
+    def _remember(self, listing: DirectoryListing) -> None:
+        """Keep a listing in memory, evicting the least recently used beyond memo_size."""
+        with self._lock:
+            self._memory[listing.path] = listing
+            self._memory.move_to_end(listing.path)
+            while len(self._memory) > self._memo_size:
+                self._memory.popitem(last=False)
+
+    def iter_listings(self, top: str) -> Iterator[DirectoryListing]:
+        """Yield the listing of top and of every real directory below it, top-down."""
+        for listing, _dirs in self._walk_listings(top):
+            yield listing
+
+    def walk(self, top: str) -> Iterator[tuple[str, list[str], list[str]]]:
+        """
+        Walk a tree top-down like os.walk(top), using cached listings.
+
+        As with os.walk, symlinked directories are reported but not walked into,
+        unreadable directories are skipped, and removing names from the yielded
+        dirs list prunes the walk.
+        """
+        for listing, dirs in self._walk_listings(top):
+            yield listing.path, dirs, listing.files
+
+    def _walk_listings(self, top: str) -> Iterator[tuple[DirectoryListing, list[str]]]:
+        """Iterative depth-first walk yielding each listing with its prunable dirs list."""
+        stack = [os.path.abspath(top)]
+        while stack:
+            listing = self.listing(stack.pop())
+            if listing is None:
+                continue
+            dirs = listing.dirs
+            yield listing, dirs
+            real_dirs = {name for name, kind, _ in listing.entries if kind == KIND_DIR}
+            # Push in reverse so subdirectories are visited in listing order
+            stack.extend(
+                os.path.join(listing.path, name) for name in reversed(dirs) if name in real_dirs
+            )
+
+    def stats(self, top: str, max_workers: int = DEFAULT_WALK_WORKERS) -> DirectoryStats:
+        """
+        Total the files and subdirectories of a tree, listing directories in parallel.
+
+        The walk is breadth-first and iterative, so deep trees cannot exhaust the
+        recursion limit. At most max_workers listings of this tree are in flight at
+        once, which hides per-directory latency on network filesystems. Symlinked
+        directories are counted but not walked into, and unreadable directories
+        are skipped, as in walk().
+        """
+        totals = DirectoryStats()
+        pending: deque[str] = deque([os.path.abspath(top)])
+        in_flight: set[Future[DirectoryListing | None]] = set()
+
+        while pending or in_flight:
+            if not in_flight and len(pending) == 1:
+                # A single directory to read: skip the thread hand-off
+                self._add_listing(totals, pending, self.listing(pending.popleft()))
+                continue
+
+            executor = self._get_executor()
+            while pending and len(in_flight) < max_workers:
+                in_flight.add(executor.submit(self.listing, pending.popleft()))
+            done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                self._add_listing(totals, pending, future.result())
+
+        return totals
+
+    @staticmethod
+    def _add_listing(
+        totals: DirectoryStats, pending: deque[str], listing: DirectoryListing | None
+    ) -> None:
+        """Count a listing and queue its real subdirectories for reading."""
+        if listing is None:
+            return
+        totals.add(listing)
+        pending.extend(
+            os.path.join(listing.path, name)
+            for name, kind, _ in listing.entries
+            if kind == KIND_DIR
+        )
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Return the worker pool shared by all stats() calls, creating it on first use."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=DEFAULT_WALK_WORKERS, thread_name_prefix="tidyflix-walk"
+                )
+            return self._executor
+
+    def forget(self, path: str) -> None:
+        """Drop the cached listing of a directory."""
+        abs_path = os.path.abspath(path)
+        with self._lock:
+            self._memory.pop(abs_path, None)
+        if self._cache is not None:
+            self._cache.delete(abs_path)
+
+
+def get_library_index() -> LibraryIndex:
+    """Return the process-wide library index, opening its on-disk cache on first use."""
+    global _library_index
+    if _library_index is None:
+        _library_index = LibraryIndex(PersistentCache("library", version=INDEX_CACHE_VERSION))
+    return _library_index
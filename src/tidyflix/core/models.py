@@ -6,8 +6,13 @@ This module contains the fundamental data structures used throughout the applica
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from typing_extensions import override
 
+if TYPE_CHECKING:
+    from tidyflix.analysis.media_probe import DirectoryProbe
+
 
 # ANSI color codes
 class Colors:
@@ -77,9 +82,12 @@ class DirectoryInfo:
         self.size_mb: float | None = None
         self.adjusted_size_mb: float | None = None  # Size adjusted for encoding efficiency
         self.video_tags: str | None = None
-        self.video_score: int | None = None  # Total score from video tags
+        self.tags: list[Tag] | None = None  # Parsed video tags
+        self.tag_score: int | None = None  # Score from video tags alone
+        self.video_score: int | None = None  # Tag score plus relative size score
         self.subtitle_summary: str | None = None
-        self.contents: list[tuple[str, str]] | None = None  # Will store directory listing
+        self.contents: list[tuple[str, str]] | None = None  # Preview, built on first display
+        self.probe: DirectoryProbe | None = None  # Shared media probes from scanning
 
 
 class DuplicateGroup:
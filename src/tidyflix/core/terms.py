@@ -0,0 +1,38 @@
+"""
+Case-insensitive term lookup.
+
+This module provides TermIndex, a precomputed table used where a name is split
+into tokens and each token is checked against a fixed vocabulary (the release
+terms of TermCapitalizer and TermMover).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Generic, TypeVar
+
+V = TypeVar("V")
+
+
+class TermIndex(Generic[V]):
+    """Maps whole tokens, compared case-insensitively, to a value in O(1) per token."""
+
+    def __init__(self, terms: Iterable[tuple[str, V]]):
+        """
+        Build the index.
+
+        Args:
+            terms: (term, value) pairs; when several terms differ only by case,
+                the first one wins
+        """
+        self._values: dict[str, V] = {}
+        for term, value in terms:
+            self._values.setdefault(term.lower(), value)
+
+    def lookup(self, token: str) -> V | None:
+        """Return the value for token, or None if it is not a term."""
+        return self._values.get(token.lower())
+
+    def __contains__(self, token: str) -> bool:
+        """Check whether token is a term."""
+        return token.lower() in self._values
@@ -8,9 +8,15 @@ directory validation, and size calculations.
 import argparse
 import difflib
 import os
+import threading
 
+from tidyflix.core.library_index import DirectoryStats, get_library_index
 from tidyflix.core.models import Colors
 
+# Directory totals computed during this run, keyed by absolute path
+_directory_size_cache: dict[str, DirectoryStats] = {}
+_directory_size_lock = threading.Lock()
+
 
 def highlight_changes(original: str, modified: str) -> tuple[str, str]:
     """
@@ -64,23 +70,50 @@ def format_size(size_bytes: int) -> str:
         return f"{size:.1f} {size_names[i]}"
 
 
+def get_directory_stats(directory_path: str) -> DirectoryStats:
+    """
+    Get total size, file count and subdirectory count of a directory tree.
+
+    Listings come from the (cached) library index and are read in parallel.
+    Results are memoized for the rest of the run; code that changes a tree must
+    call invalidate_directory_size() on it.
+    """
+    abs_path = os.path.abspath(directory_path)
+    with _directory_size_lock:
+        cached = _directory_size_cache.get(abs_path)
+    if cached is not None:
+        return cached
+
+    # Unreadable directories are skipped; symlinks are not followed
+    stats = get_library_index().stats(abs_path)
+
+    with _directory_size_lock:
+        _directory_size_cache[abs_path] = stats
+    return stats
+
+
 def get_directory_size(directory_path: str) -> int:
-    """Get total size of directory in bytes using efficient os.scandir method."""
-    total_size = 0
-    try:
-        for entry in os.scandir(directory_path):
-            try:
-                if entry.is_file(follow_symlinks=False):
-                    total_size += entry.stat(follow_symlinks=False).st_size
-                elif entry.is_dir(follow_symlinks=False):
-                    total_size += get_directory_size(entry.path)
-            except (OSError, PermissionError):
-                # Skip files/directories that can't be accessed
-                continue
-    except (OSError, PermissionError):
-        # Return 0 if we can't access the directory
-        pass
-    return total_size
+    """Get total size of directory in bytes."""
+    return get_directory_stats(directory_path).size
+
+
+def invalidate_directory_size(path: str) -> None:
+    """
+    Forget memoized sizes affected by a change to path.
+
+    Call this after renaming, deleting or writing into path. The sizes of path,
+    everything below it and all of its ancestors are dropped.
+    """
+    abs_path = os.path.abspath(path)
+    below = abs_path.rstrip(os.sep) + os.sep
+    with _directory_size_lock:
+        for cached_path in list(_directory_size_cache):
+            if (
+                cached_path == abs_path
+                or cached_path.startswith(below)
+                or below.startswith(cached_path.rstrip(os.sep) + os.sep)
+            ):
+                del _directory_size_cache[cached_path]
 
 
 def get_directory_info(directory_path: str) -> str:
@@ -92,18 +125,10 @@ def get_directory_info(directory_path: str) -> str:
         return "Not a directory"
 
     try:
-        # Count files and subdirectories
-        file_count = 0
-        dir_count = 0
-
-        for _root, dirs, files in os.walk(directory_path):
-            file_count += len(files)
-            dir_count += len(dirs)
-
-        size = get_directory_size(directory_path)
-        size_str = format_size(size)
+        stats = get_directory_stats(directory_path)
+        size_str = format_size(stats.size)
 
-        return f"{size_str}, {file_count} files, {dir_count} subdirectories"
+        return f"{size_str}, {stats.file_count} files, {stats.dir_count} subdirectories"
     except (OSError, PermissionError):
         return "Permission denied"
 
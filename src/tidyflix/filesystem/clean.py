@@ -4,7 +4,8 @@ from __future__ import annotations
 
 import os
 
-from tidyflix.core.utils import format_size, validate_directory
+from tidyflix.core.library_index import get_library_index
+from tidyflix.core.utils import format_size, invalidate_directory_size, validate_directory
 
 
 def clean_unwanted_files(target_directories: list[str] | None = None, dry_run: bool = False):
@@ -32,7 +33,7 @@ def clean_unwanted_files(target_directories: list[str] | None = None, dry_run: b
         skipped_files: list[str] = []
 
         # Walk through all directories recursively
-        for root, _dirs, files in os.walk(validated_target_directory):
+        for root, _dirs, files in get_library_index().walk(validated_target_directory):
             for file in files:
                 if file.lower().endswith((".txt", ".exe", ".url")):
                     file_path = os.path.join(root, file)
@@ -78,6 +79,7 @@ def clean_unwanted_files(target_directories: list[str] | None = None, dry_run: b
                     try:
                         file_size = os.path.getsize(file_path)
                         os.remove(file_path)
+                        invalidate_directory_size(os.path.dirname(file_path))
                         print(f"  Deleted: {file_path} ({format_size(file_size)})")
                     except OSError as e:
                         print(f"  Error deleting {file_path}: {e}")
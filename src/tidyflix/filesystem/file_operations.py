@@ -13,6 +13,7 @@ from tidyflix.analysis.subtitle_analyzer import (
     is_media_file,
 )
 from tidyflix.core.models import Colors
+from tidyflix.core.utils import invalidate_directory_size
 
 
 def get_main_video_file(directory: str) -> str | None:
@@ -161,6 +162,7 @@ def copy_additional_subtitles(kept_directory: str, directories_to_delete: list[s
                     print(f"  Error copying {original_filename}: {e}")
 
     if copied_count > 0:
+        invalidate_directory_size(kept_directory)
         print(f"Successfully copied {copied_count} subtitle file(s)")
 
     return copied_count > 0
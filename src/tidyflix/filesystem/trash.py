@@ -0,0 +1,76 @@
+"""
+Trash directories for instant, undoable deletes.
+
+Instead of removing a directory tree, it is renamed into a .tidyflix-trash
+directory next to it. A rename within one filesystem is atomic and takes the
+same time regardless of the size of the tree; the actual removal happens
+later with `tidyflix purge`. Until then a trashed directory can be restored by
+moving it back out of the trash.
+"""
+
+from __future__ import annotations
+
+import os
+
+from tidyflix.core.config import TRASH_DIR_NAME
+from tidyflix.core.utils import invalidate_directory_size
+
+
+def get_trash_dir(path: str) -> str:
+    """Return the trash directory a path is moved into (beside the path itself)."""
+    return os.path.join(os.path.dirname(os.path.abspath(path)), TRASH_DIR_NAME)
+
+
+def _reserve(destination: str, is_dir: bool) -> bool:
+    """Atomically create an empty placeholder at destination; False if the name is taken."""
+    try:
+        if is_dir:
+            os.mkdir(destination)
+        else:
+            os.close(os.open(destination, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+    except FileExistsError:
+        return False
+    return True
+
+
+def move_to_trash(path: str) -> str:
+    """
+    Rename a directory into its trash directory.
+
+    The trash lives in the same parent directory, so the rename never crosses a
+    filesystem boundary (unless path is itself a mount point, in which case the
+    OSError from os.rename is raised). A name already taken in the trash gets a
+    numeric suffix. The name is reserved with an empty placeholder created
+    atomically before the rename replaces it, so concurrent moves (see
+    delete_directories) never pick the same name or overwrite each other.
+
+    Returns the path of the directory inside the trash.
+    """
+    abs_path = os.path.abspath(path)
+    trash_dir = get_trash_dir(abs_path)
+    os.makedirs(trash_dir, exist_ok=True)
+
+    is_dir = os.path.isdir(abs_path) and not os.path.islink(abs_path)
+    name = os.path.basename(abs_path)
+    destination = os.path.join(trash_dir, name)
+    suffix = 1
+    while not _reserve(destination, is_dir):
+        suffix += 1
+        destination = os.path.join(trash_dir, f"{name}.{suffix}")
+
+    try:
+        os.replace(abs_path, destination)
+    except OSError:
+        (os.rmdir if is_dir else os.remove)(destination)
+        raise
+    invalidate_directory_size(abs_path)
+    return destination
+
+
+def list_trash(root: str) -> list[str]:
+    """Return the paths of everything in the trash directory of a library root."""
+    trash_dir = os.path.join(os.path.abspath(root), TRASH_DIR_NAME)
+    try:
+        return sorted(os.path.join(trash_dir, name) for name in os.listdir(trash_dir))
+    except OSError:
+        return []
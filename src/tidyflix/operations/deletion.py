@@ -7,42 +7,195 @@ and actual file system deletion operations.
 
 import os
 import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
+from tidyflix.core.config import DEFAULT_DELETE_JOBS, TRASH_DIR_NAME
 from tidyflix.core.models import Colors
 from tidyflix.core.utils import get_directory_size as get_dir_size
+from tidyflix.core.utils import invalidate_directory_size
+from tidyflix.filesystem.trash import list_trash, move_to_trash
 
 
-def show_deletion_confirmation(to_delete: list[str]):
-    """Show deletion confirmation and handle the deletion process."""
+class DeletionSummary:
+    """Outcome of deleting a batch of directories."""
+
+    def __init__(self, total: int):
+        self.total: int = total
+        self.deleted: list[str] = []
+        self.failed: list[tuple[str, str]] = []  # (path, error message)
+        self.bytes_freed: int = 0
+        self.seconds: float = 0.0
+
+    @property
+    def rate(self) -> float:
+        """Directories processed per second."""
+        processed = len(self.deleted) + len(self.failed)
+        return processed / self.seconds if self.seconds > 0 else 0.0
+
+
+def _remove_directory(path: str) -> None:
+    """Delete a directory tree (or a single file) and forget its memoized size."""
+    if os.path.isdir(path) and not os.path.islink(path):
+        shutil.rmtree(path)
+    else:
+        os.remove(path)
+    invalidate_directory_size(path)
+
+
+def delete_directories(
+    to_delete: list[str],
+    sizes: dict[str, int],
+    jobs: int = DEFAULT_DELETE_JOBS,
+    trash: bool = False,
+) -> DeletionSummary:
+    """
+    Delete directory trees with a bounded thread pool, printing progress as each finishes.
+
+    Args:
+        to_delete: Directories to delete
+        sizes: Size in bytes of each directory, used to report space freed
+        jobs: Number of directories deleted concurrently
+        trash: Move directories into their trash directory instead of removing them
+
+    Returns a DeletionSummary with the deleted paths, failures and throughput.
+    """
+    summary = DeletionSummary(len(to_delete))
+    started = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=max(1, jobs), thread_name_prefix="tidyflix-delete") as pool:
+        remove = move_to_trash if trash else _remove_directory
+        futures = {pool.submit(remove, path): path for path in to_delete}
+        for future in as_completed(futures):
+            path = futures[future]
+            name = os.path.basename(path)
+            try:
+                future.result()
+            except Exception as e:
+                summary.failed.append((path, str(e)))
+                message = f"{Colors.RED}Error deleting {name}: {e}{Colors.RESET}"
+            else:
+                summary.deleted.append(path)
+                summary.bytes_freed += sizes.get(path, 0)
+                message = f"Moved to trash: {name}" if trash else f"Deleted: {name}"
+
+            summary.seconds = time.perf_counter() - started
+            done = len(summary.deleted) + len(summary.failed)
+            print(
+                f"[{done}/{summary.total}] {message} {Colors.GREY}"
+                f"({summary.bytes_freed / (1024 * 1024):.2f} MB {'trashed' if trash else 'freed'}, "
+                f"{summary.rate:.1f} dirs/sec){Colors.RESET}"
+            )
+
+    summary.seconds = time.perf_counter() - started
+    return summary
+
+
+def show_deletion_confirmation(
+    to_delete: list[str],
+    auto_accept: bool = False,
+    jobs: int = DEFAULT_DELETE_JOBS,
+    trash: bool = False,
+):
+    """
+    Show deletion confirmation and handle the deletion process.
+
+    Sizes come from the memoized directory sizes, so directories measured
+    during scanning are not walked again. With auto_accept the list is still
+    shown, but deletion starts without asking. With trash the directories are
+    moved into trash directories, to be removed later by purge_trash().
+    """
     if not to_delete:
         print("\nNo directories selected for deletion.")
         return
 
     print(f"\n=== DIRECTORIES TO DELETE ({len(to_delete)} items) ===")
-    total_bytes = 0
+    sizes: dict[str, int] = {}
     for d in to_delete:
-        size_bytes = get_dir_size(d)
-        size_mb = size_bytes / (1024 * 1024)
-        total_bytes += size_bytes
-        print(f"{os.path.basename(d):40s} {size_mb:10.2f} MB")
+        sizes[d] = get_dir_size(d)
+        print(f"{os.path.basename(d):40s} {sizes[d] / (1024 * 1024):10.2f} MB")
 
-    total_mb = total_bytes / (1024 * 1024)
+    total_mb = sum(sizes.values()) / (1024 * 1024)
     print(f"\n{Colors.GREEN}Total space to free: {total_mb:.2f} MB{Colors.RESET}")
 
     while True:
-        confirm = input("\nConfirm deletion? (y/n): ").strip().lower()
+        confirm = "y" if auto_accept else input("\nConfirm deletion? (y/n): ").strip().lower()
         if confirm in ["yes", "y"]:
-            print("\nDeleting directories...")
-            for d in to_delete:
-                try:
-                    shutil.rmtree(d)
-                    print(f"Deleted: {os.path.basename(d)}")
-                except Exception as e:
-                    print(f"Error deleting {os.path.basename(d)}: {e}")
-            print(f"\nDeletion complete. {len(to_delete)} directories processed.")
+            print("\nMoving directories to trash..." if trash else "\nDeleting directories...")
+            summary = delete_directories(to_delete, sizes, jobs, trash=trash)
+            if trash:
+                print(
+                    f"\n{len(summary.deleted)} of {summary.total} directories moved to trash. "
+                    f"Run 'tidyflix purge' to free {summary.bytes_freed / (1024 * 1024):.2f} MB."
+                )
+            else:
+                print(
+                    f"\nDeletion complete. {len(summary.deleted)} of {summary.total} directories "
+                    f"deleted, {summary.bytes_freed / (1024 * 1024):.2f} MB freed in "
+                    f"{summary.seconds:.1f}s ({summary.rate:.1f} dirs/sec)."
+                )
+            if summary.failed:
+                print(
+                    f"{Colors.RED}Failed to delete {len(summary.failed)} directories:{Colors.RESET}"
+                )
+                for path, error in summary.failed:
+                    print(f"  {path}: {error}")
             break
         elif confirm in ["n", "no"]:
             print("Deletion cancelled.")
             break
         else:
             print("Please enter valid selection.")
+
+
+def purge_trash(
+    target_directories: list[str], dry_run: bool = False, jobs: int = DEFAULT_DELETE_JOBS
+) -> bool:
+    """
+    Permanently remove everything in the trash directories of library roots.
+
+    Args:
+        target_directories: Library roots whose trash directories are purged
+        dry_run: Only list what would be removed
+        jobs: Number of trashed directories removed concurrently
+
+    Returns True if everything was removed, False if any removal failed.
+    """
+    to_purge: list[str] = []
+    for target_directory in target_directories:
+        to_purge.extend(list_trash(target_directory))
+
+    if not to_purge:
+        print("Trash is empty.")
+        return True
+
+    print(f"=== TRASH ({len(to_purge)} items) ===")
+    sizes: dict[str, int] = {}
+    for path in to_purge:
+        sizes[path] = get_dir_size(path) if os.path.isdir(path) else os.path.getsize(path)
+        print(f"{os.path.basename(path):40s} {sizes[path] / (1024 * 1024):10.2f} MB")
+    print(
+        f"\n{Colors.GREEN}Total space to free: {sum(sizes.values()) / (1024 * 1024):.2f} MB{Colors.RESET}"
+    )
+
+    if dry_run:
+        print("\nDry run: nothing was removed.")
+        return True
+
+    print("\nPurging trash...")
+    summary = delete_directories(to_purge, sizes, jobs)
+    for target_directory in target_directories:
+        try:
+            os.rmdir(os.path.join(os.path.abspath(target_directory), TRASH_DIR_NAME))
+        except OSError:
+            pass  # Missing, or still holds entries that failed to purge
+
+    print(
+        f"\nPurge complete. {len(summary.deleted)} of {summary.total} items removed, "
+        f"{summary.bytes_freed / (1024 * 1024):.2f} MB freed in {summary.seconds:.1f}s."
+    )
+    if summary.failed:
+        print(f"{Colors.RED}Failed to remove {len(summary.failed)} items:{Colors.RESET}")
+        for path, error in summary.failed:
+            print(f"  {path}: {error}")
+    return not summary.failed
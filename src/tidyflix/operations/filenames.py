@@ -9,7 +9,7 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from tidyflix.core.config import SUBTITLE_EXTENSIONS
+from tidyflix.core.config import SUBTITLE_EXTENSIONS, TRASH_DIR_NAME
 from tidyflix.core.models import Colors
 from tidyflix.core.utils import highlight_changes
 from tidyflix.filesystem.file_operations import get_main_video_file
@@ -152,7 +152,7 @@ def normalize_filenames(target_directories: list[str], dry_run: bool = False) ->
         # Find all subdirectories
         subdirectories = []
         for item in dir_path.iterdir():
-            if item.is_dir():
+            if item.is_dir() and item.name != TRASH_DIR_NAME:
                 subdirectories.append(item)
 
         if not subdirectories:
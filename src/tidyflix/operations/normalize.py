@@ -2,22 +2,39 @@
 
 from __future__ import annotations
 
+import functools
+import hashlib
+import inspect
 import os
 import re
 import shutil
 import tempfile
+import time
 from abc import ABC, ABCMeta, abstractmethod
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 
 from typing_extensions import override
 
+from tidyflix.core.cache import PersistentCache
+from tidyflix.core.config import NORMALIZE_BATCH_CHUNK, NORMALIZE_MEMO_SIZE
+from tidyflix.core.library_index import get_library_index
+from tidyflix.core.terms import TermIndex
 from tidyflix.core.utils import (
     get_directory_info,
     get_directory_size,
     highlight_changes,
+    invalidate_directory_size,
     validate_directory,
 )
+from tidyflix.filesystem.trash import move_to_trash
 from tidyflix.operations.verify import _has_media_files_recursive
 
+# Bump when the pipeline's semantics change in a way the fingerprint cannot see
+NORMALIZE_CACHE_VERSION = 1
+
+_pipeline: NormalizePipeline | None = None
+
 
 class NormalizeMeta(ABCMeta):
     """Metaclass that automatically registers normalizer classes."""
@@ -59,23 +76,272 @@ class Normalize(ABC, metaclass=NormalizeMeta):
         Returns:
             The normalized string
         """
+        return cls.pipeline().run(text, max_iterations=max_iterations, explain=explain)
+
+    @classmethod
+    def normalize_many(cls, names: Iterable[str], jobs: int = 1) -> Iterator[NormalizeResult]:
+        """
+        Normalize many strings, yielding one NormalizeResult per name in input order.
+
+        Args:
+            names: Strings to normalize; consumed lazily when jobs is 1
+            jobs: Number of worker processes; values above 1 use a process pool,
+                which only pays off for batches of many thousands of names
+
+        Yields:
+            NormalizeResult for each input name
+        """
+        if jobs <= 1:
+            pipeline = cls.pipeline()
+            for name in names:
+                yield pipeline.trace(name)
+            return
+
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            yield from executor.map(_trace_name, names, chunksize=NORMALIZE_BATCH_CHUNK)
+
+    @classmethod
+    def normalize_cached(cls, text: str) -> str:
+        """Normalize a string, reusing results remembered in memory or on disk."""
+        return cls.pipeline().normalize_cached(text)
+
+    @classmethod
+    def pipeline(cls) -> NormalizePipeline:
+        """Return the shared pipeline of registered normalizers, building it on first use."""
+        global _pipeline
+        if _pipeline is None or _pipeline.normalizer_classes != NormalizeMeta.registry:
+            _pipeline = NormalizePipeline(NormalizeMeta.registry)
+        return _pipeline
+
+
+class NormalizeResult:
+    """Outcome of normalizing a single string."""
+
+    def __init__(
+        self,
+        original: str,
+        normalized: str,
+        applied: list[str],
+        iterations: int = 0,
+        invocations: int = 0,
+    ):
+        """
+        Initialize a NormalizeResult object.
+
+        Args:
+            original: The input string
+            normalized: The fully normalized string
+            applied: Names of the normalizers that changed the text, in the order they fired
+            iterations: Number of passes over the normalizers
+            invocations: Number of normalize() calls actually made
+        """
+        self.original: str = original
+        self.normalized: str = normalized
+        self.applied: list[str] = applied
+        self.iterations: int = iterations
+        self.invocations: int = invocations
+
+    @property
+    def changed(self) -> bool:
+        """Whether normalization changed the string."""
+        return self.original != self.normalized
+
+    @override
+    def __repr__(self) -> str:
+        """Return a string representation for debugging."""
+        return (
+            f"NormalizeResult(original={self.original!r}, normalized={self.normalized!r}, "
+            f"applied={self.applied!r}, iterations={self.iterations}, "
+            f"invocations={self.invocations})"
+        )
+
+
+class NormalizeProfile:
+    """Call counts and timings per normalizer and per fixpoint iteration, over many names."""
+
+    def __init__(self):
+        self.names: int = 0
+        self.iterations: int = 0
+        self.invocations: int = 0
+        self.calls: dict[str, int] = {}
+        self.changes: dict[str, int] = {}
+        self.seconds: dict[str, float] = {}
+        # Indexed by iteration number (0 = first pass over the normalizers)
+        self.iteration_calls: list[int] = []
+        self.iteration_seconds: list[float] = []
+
+    def add_call(self, normalizer_name: str, seconds: float, iteration: int = 0) -> None:
+        """Record one normalize() call made during the given iteration."""
+        self.calls[normalizer_name] = self.calls.get(normalizer_name, 0) + 1
+        self.seconds[normalizer_name] = self.seconds.get(normalizer_name, 0.0) + seconds
+        while len(self.iteration_calls) <= iteration:
+            self.iteration_calls.append(0)
+            self.iteration_seconds.append(0.0)
+        self.iteration_calls[iteration] += 1
+        self.iteration_seconds[iteration] += seconds
+
+    def add_result(self, result: NormalizeResult) -> None:
+        """Record the outcome of normalizing one name."""
+        self.names += 1
+        self.iterations += result.iterations
+        self.invocations += result.invocations
+        for normalizer_name in result.applied:
+            self.changes[normalizer_name] = self.changes.get(normalizer_name, 0) + 1
+
+    def format_report(self) -> list[str]:
+        """Return a table of normalizers ranked by total time, followed by totals."""
+        total_seconds = sum(self.seconds.values())
+        lines = [f"{'Normalizer':<34} {'Calls':>9} {'Changes':>9} {'Time (ms)':>10} {'Share':>6}"]
+        for normalizer_name, seconds in sorted(
+            self.seconds.items(), key=lambda item: item[1], reverse=True
+        ):
+            share = seconds / total_seconds if total_seconds else 0.0
+            lines.append(
+                f"{normalizer_name:<34} {self.calls[normalizer_name]:>9} "
+                f"{self.changes.get(normalizer_name, 0):>9} {seconds * 1000:>10.2f} {share:>6.1%}"
+            )
+        if self.iteration_calls:
+            lines.append("")
+            lines.append(f"{'Iteration':<34} {'Calls':>9} {'':>9} {'Time (ms)':>10} {'Share':>6}")
+            for iteration, (calls, seconds) in enumerate(
+                zip(self.iteration_calls, self.iteration_seconds, strict=True)
+            ):
+                share = seconds / total_seconds if total_seconds else 0.0
+                lines.append(
+                    f"{iteration + 1:<34} {calls:>9} {'':>9} {seconds * 1000:>10.2f} {share:>6.1%}"
+                )
+        if self.names:
+            lines.append(
+                f"{self.names} names, {self.iterations / self.names:.2f} iterations and "
+                f"{self.invocations / self.names:.1f} normalizer calls per name"
+            )
+        return lines
+
+
+class NormalizePipeline:
+    """Registered normalizers instantiated once and applied until the text stops changing."""
+
+    def __init__(self, normalizer_classes: list[type[Normalize]]):
+        """
+        Instantiate each normalizer once.
+
+        Args:
+            normalizer_classes: Normalizer classes in the order they are applied
+        """
+        self.normalizer_classes: list[type[Normalize]] = list(normalizer_classes)
+        self.normalizers: list[Normalize] = [
+            normalizer_class() for normalizer_class in self.normalizer_classes
+        ]
+        self.fingerprint: str = _fingerprint_normalizers(self.normalizer_classes)
+        self._cache: PersistentCache | None = None
+        self._memoized = functools.lru_cache(maxsize=NORMALIZE_MEMO_SIZE)(self._lookup)
+
+    def normalize_cached(self, text: str) -> str:
+        """
+        Normalize a string with default settings, memoizing the result.
+
+        Results are kept in a bounded in-memory LRU and in a persistent cache
+        versioned by this pipeline's fingerprint, so changing the normalizers
+        discards everything normalized with the old ones.
+        """
+        return self._memoized(text)
+
+    def _lookup(self, text: str) -> str:
+        """Return the normalized text from the persistent cache, computing it on a miss."""
+        if self._cache is None:
+            self._cache = PersistentCache(
+                "normalize", version=f"{NORMALIZE_CACHE_VERSION}-{self.fingerprint}"
+            )
+        stored = self._cache.get(text)
+        if isinstance(stored, str):
+            return stored
+        result = self.run(text)
+        self._cache.set(text, result)
+        return result
+
+    def run(self, text: str, max_iterations: int = 10, explain: bool = False) -> str:
+        """
+        Apply all normalizers iteratively until no further changes occur.
+
+        Args:
+            text: The string to normalize
+            max_iterations: Maximum number of iterations to prevent infinite loops
+            explain: If True, log changes made by each normalizer
+
+        Returns:
+            The normalized string
+        """
+        return self.trace(text, max_iterations=max_iterations, explain=explain).normalized
+
+    def trace(
+        self,
+        text: str,
+        max_iterations: int = 10,
+        explain: bool = False,
+        profile: NormalizeProfile | None = None,
+    ) -> NormalizeResult:
+        """
+        Normalize a string like run(), recording which normalizers changed it.
+
+        Normalizers are deterministic, so one that already left the current text
+        unchanged would do so again; it is skipped until another normalizer changes
+        the text. The loop ends as soon as every normalizer has seen the current
+        text without changing it, which usually saves most of the final pass.
+
+        This is not a dependency-tracking worklist: any change makes every other
+        normalizer eligible again, since normalizers do not declare what they read
+        or write. On the devtools/bench_normalize.py corpus it cuts normalizer
+        calls from about 30.6 to 24.9 per name (about 19%).
+
+        Args:
+            text: The string to normalize
+            max_iterations: Maximum number of iterations to prevent infinite loops
+            explain: If True, log changes made by each normalizer
+            profile: If given, per-normalizer timings and counters are added to it
+
+        Returns:
+            NormalizeResult with the normalized string and the normalizers that fired
+        """
         current_text = text
+        applied: list[str] = []
+        iterations = 0
+        invocations = 0
+        # Text each normalizer last left unchanged; None until it has run
+        settled_on: list[str | None] = [None] * len(self.normalizers)
+        settled_count = 0  # Normalizers that have all seen current_text without changing it
 
         for iteration in range(max_iterations):
             previous_text = current_text
             iteration_changes = False
+            iterations += 1
 
-            # Apply all registered normalizers
-            for normalizer_class in NormalizeMeta.registry:
-                normalizer = normalizer_class()
+            for index, normalizer in enumerate(self.normalizers):
+                if settled_count == len(self.normalizers):
+                    break
+                if settled_on[index] == current_text:
+                    continue
                 before_normalize = current_text
-                current_text = normalizer.normalize(current_text)
+                if profile is None:
+                    current_text = normalizer.normalize(current_text)
+                else:
+                    started = time.perf_counter()
+                    current_text = normalizer.normalize(current_text)
+                    profile.add_call(
+                        type(normalizer).__name__, time.perf_counter() - started, iteration
+                    )
+                invocations += 1
+                if before_normalize == current_text:
+                    settled_on[index] = current_text
+                    settled_count += 1
+                    continue
+                applied.append(type(normalizer).__name__)
+                settled_count = 0
 
-                if explain and before_normalize != current_text:
+                if explain:
                     orig_highlighted, new_highlighted = highlight_changes(
                         before_normalize, current_text
                     )
-                    print(f"  {normalizer_class.__name__}:")
+                    print(f"  {type(normalizer).__name__}:")
                     print(f"    Before: '{orig_highlighted}'")
                     print(f"    After:  '{new_highlighted}'")
                     iteration_changes = True
@@ -87,9 +353,33 @@ class Normalize(ABC, metaclass=NormalizeMeta):
                 print(f"  End of iteration {iteration + 1}: '{current_text}'")
 
         if explain and text != current_text:
-            print(f"Final result: '{current_text}'")
+            print(
+                f"Final result: '{current_text}' "
+                f"({iterations} iterations, {invocations} normalizer calls)"
+            )
+
+        result = NormalizeResult(text, current_text, applied, iterations, invocations)
+        if profile is not None:
+            profile.add_result(result)
+        return result
 
-        return current_text
+
+def _trace_name(text: str) -> NormalizeResult:
+    """Normalize one name with the shared pipeline (process pool worker entry point)."""
+    return Normalize.pipeline().trace(text)
+
+
+def _fingerprint_normalizers(normalizer_classes: list[type[Normalize]]) -> str:
+    """Hash the names and source code of normalizer classes, in order."""
+    digest = hashlib.sha256()
+    for normalizer_class in normalizer_classes:
+        digest.update(f"{normalizer_class.__module__}.{normalizer_class.__qualname__}\n".encode())
+        try:
+            digest.update(inspect.getsource(normalizer_class).encode())
+        except (OSError, TypeError):
+            # Source unavailable (e.g. frozen build); the class name still counts
+            pass
+    return digest.hexdigest()[:16]
 
 
 class SubstringRemovalNormalizer(Normalize):
@@ -108,13 +398,17 @@ class SubstringRemovalNormalizer(Normalize):
         "[ www.torrentday.com ]",
     ]
 
+    def __init__(self):
+        # One alternation for all substrings; longest first so overlapping entries
+        # prefer the most specific match
+        substrings = sorted(self.SUBSTRINGS_TO_REMOVE, key=len, reverse=True)
+        self._pattern: re.Pattern[str] = re.compile(
+            "|".join(re.escape(substring) for substring in substrings), re.IGNORECASE
+        )
+
     @override
     def normalize(self, text: str) -> str:
-        result = text
-        for substring in self.SUBSTRINGS_TO_REMOVE:
-            pattern = re.compile(re.escape(substring), re.IGNORECASE)
-            result = pattern.sub(".", result)
-        return result
+        return self._pattern.sub(".", text)
 
 
 class SpaceReplacementNormalizer(Normalize):
@@ -132,36 +426,47 @@ class SpaceReplacementNormalizer(Normalize):
 class DotCollapseNormalizer(Normalize):
     """Collapses multiple consecutive dots into a single dot."""
 
+    PATTERN: re.Pattern[str] = re.compile(r"\.{2,}")
+
     @override
     def normalize(self, text: str) -> str:
-        return re.sub(r"\.{2,}", ".", text)
+        return self.PATTERN.sub(".", text)
 
 
 class ColonRemovalNormalizer(Normalize):
     """Removes various types of colons and colon-like characters."""
 
+    PATTERN: re.Pattern[str] = re.compile(r"[:\uA789\u2236\uFF1A\u02D0]")
+
     @override
     def normalize(self, text: str) -> str:
-        return re.sub(r"[:\uA789\u2236\uFF1A\u02D0]", "", text)
+        return self.PATTERN.sub("", text)
 
 
 class SpecialDotPatternNormalizer(Normalize):
     """Replaces patterns like .-. .+. .~. .–. with single dot."""
 
+    PATTERN: re.Pattern[str] = re.compile(r"\.[\-\+\~\u2013]\.")
+
     @override
     def normalize(self, text: str) -> str:
-        return re.sub(r"\.[\-\+\~\u2013]\.", ".", text)
+        return self.PATTERN.sub(".", text)
 
 
 class EndBracketReplacementNormalizer(Normalize):
     """Replaces end bracket patterns with dash format."""
 
+    END_BRACKET_PATTERN: re.Pattern[str] = re.compile(r"^(.*?)(\[[^\]]+\])$")
+    GROUP_SUFFIX_PATTERN: re.Pattern[str] = re.compile(r"-\w+$")
+
     @override
     def normalize(self, text: str) -> str:
-        m = re.match(r"^(.*?)(\[[^\]]+\])$", text)
+        if "]" not in text:
+            return text
+        m = self.END_BRACKET_PATTERN.match(text)
         if m:
             before, bracketed = m.groups()
-            if not re.search(r"-\w+$", before):
+            if not self.GROUP_SUFFIX_PATTERN.search(before):
                 return before + "-" + bracketed[1:-1]
         return text
 
@@ -169,10 +474,12 @@ class EndBracketReplacementNormalizer(Normalize):
 class ParensBracketsBracesNormalizer(Normalize):
     """Replaces parentheses, brackets, and braces with dots."""
 
+    PATTERN: re.Pattern[str] = re.compile(r"[\(\)\[\]\{\}]")
+
     @override
     def normalize(self, text: str) -> str:
         # replace with dot so that (2019)(720p) does not become 2019720p
-        return re.sub(r"[\(\)\[\]\{\}]", ".", text)
+        return self.PATTERN.sub(".", text)
 
 
 class DashDotNormalizer(Normalize):
@@ -182,18 +489,20 @@ class DashDotNormalizer(Normalize):
     def normalize(self, text: str) -> str:
         result = text
         # Replace -. with single dot
-        result = re.sub(r"\-\.", ".", result)
+        result = result.replace("-.", ".")
         # Replace .- with single dot
-        result = re.sub(r"\.\-", ".", result)
+        result = result.replace(".-", ".")
         return result
 
 
 class TrailingCrapNormalizer(Normalize):
     """Removes trailing non-alphanumeric characters."""
 
+    PATTERN: re.Pattern[str] = re.compile(r"[^A-Za-z0-9]+$")
+
     @override
     def normalize(self, text: str) -> str:
-        return re.sub(r"[^A-Za-z0-9]+$", "", text)
+        return self.PATTERN.sub("", text)
 
 
 class TrailingDotNormalizer(Normalize):
@@ -210,6 +519,8 @@ class TitleCaseNormalizer(Normalize):
     Preserves words that are 4 letters or less and in uppercase.
     """
 
+    YEAR_PATTERN: re.Pattern[str] = re.compile(r"\d{4}")
+
     @override
     def normalize(self, text: str) -> str:
         if not text:
@@ -220,7 +531,7 @@ class TitleCaseNormalizer(Normalize):
         # Find the year part (if any) to determine which parts to check
         year_index = None
         for i, part in enumerate(parts):
-            if re.search(r"\d{4}", part):
+            if self.YEAR_PATTERN.search(part):
                 year_index = i
                 break
 
@@ -246,7 +557,7 @@ class TitleCaseNormalizer(Normalize):
 
         for part in parts:
             # Check if this part is 4 digits (year)
-            if re.search(r"\d{4}", part):
+            if self.YEAR_PATTERN.search(part):
                 # Found year, add it as-is and stop capitalizing
                 result_parts.append(part)
                 # Add remaining parts unchanged
@@ -326,22 +637,19 @@ class TermCapitalizer(Normalize):
         ("peacock", "Peacock"),
     ]
 
+    def __init__(self):
+        self._terms: TermIndex[str] = TermIndex(self.TERM_CAPITALIZATIONS)
+
     @override
     def normalize(self, text: str) -> str:
-        result = text
         # Split by dots to handle each part separately
-        parts = result.split(".")
-
-        for i, part in enumerate(parts):
-            # Skip the first word (index 0) - never capitalize it
-            if i == 0:
-                continue
+        parts = text.split(".")
 
-            # Check each term capitalization pair
-            for lowercase_term, preferred_cap in self.TERM_CAPITALIZATIONS:
-                if part.lower() == lowercase_term.lower():
-                    parts[i] = preferred_cap
-                    break
+        # Skip the first word (index 0) - never capitalize it
+        for i in range(1, len(parts)):
+            preferred_cap = self._terms.lookup(parts[i])
+            if preferred_cap is not None:
+                parts[i] = preferred_cap
 
         return ".".join(parts)
 
@@ -360,6 +668,11 @@ class TermMover(Normalize):
         "internal",
     ]
 
+    YEAR_PATTERN: re.Pattern[str] = re.compile(r"^\d{4}$")
+
+    def __init__(self):
+        self._terms: TermIndex[str] = TermIndex((term, term) for term in self.TERMS_TO_MOVE)
+
     @override
     def normalize(self, text: str) -> str:
         if not text:
@@ -370,7 +683,7 @@ class TermMover(Normalize):
         # Find the year part
         year_index = None
         for i, part in enumerate(parts):
-            if re.search(r"^\d{4}$", part):
+            if self.YEAR_PATTERN.search(part):
                 year_index = i
                 break
 
@@ -384,7 +697,7 @@ class TermMover(Normalize):
 
         for i in range(year_index):
             part = parts[i]
-            if part.lower() in [term.lower() for term in self.TERMS_TO_MOVE]:
+            if part in self._terms:
                 terms_to_move.append(part)
                 indices_to_remove.append(i)
 
@@ -499,18 +812,38 @@ def check_case_only_rename_safety(old_path: str, new_path: str, directory: str)
     return True  # Case-sensitive filesystem - safe
 
 
+def _delete_directory(path: str, trash: bool) -> None:
+    """Remove a directory tree, or move it into the trash when trash is set."""
+    if trash:
+        move_to_trash(path)
+    else:
+        shutil.rmtree(path)
+        invalidate_directory_size(path)
+
+
 def normalize_directories(
     target_directories: list[str] | None = None,
     dry_run: bool = False,
     explain: bool = False,
     auto_accept: bool = False,
+    profile: bool = False,
+    trash: bool = False,
 ):
-    """Normalize directory names by applying string normalization rules."""
+    """
+    Normalize directory names by applying string normalization rules.
+
+    With profile set, every name is normalized from scratch (bypassing the
+    normalization caches) and a ranked table of time spent per normalizer and
+    per fixpoint iteration is printed at the end. With trash set, directories
+    deleted to resolve naming conflicts are moved into the trash instead.
+    """
     if target_directories is None:
         target_directories = ["."]
 
     print(f"Registered normalizers: {len(NormalizeMeta.registry)}")
 
+    normalize_profile = NormalizeProfile() if profile else None
+
     all_success = True
 
     for target_directory in target_directories:
@@ -522,15 +855,19 @@ def normalize_directories(
 
         print(f"\nProcessing directory: {validated_target_directory}")
 
-        directories = [
-            d
-            for d in os.listdir(validated_target_directory)
-            if os.path.isdir(os.path.join(validated_target_directory, d))
-        ]
+        listing = get_library_index().listing(validated_target_directory)
+        directories = listing.dirs if listing is not None else []
 
         for dir_name in directories:
             old_path = os.path.join(validated_target_directory, dir_name)
-            new_dir_name = Normalize.normalize_string(dir_name, explain=explain)
+            if explain or normalize_profile is not None:
+                new_dir_name = (
+                    Normalize.pipeline()
+                    .trace(dir_name, explain=explain, profile=normalize_profile)
+                    .normalized
+                )
+            else:
+                new_dir_name = Normalize.normalize_cached(dir_name)
 
             if dir_name == new_dir_name:
                 continue
@@ -611,12 +948,12 @@ def normalize_directories(
                     if directory_to_delete == new_path:
                         # Delete destination, then rename source
                         print(f"Deleting destination directory: {new_path}")
-                        shutil.rmtree(new_path)
+                        _delete_directory(new_path, trash)
                         # Continue with normal rename below
                     else:
                         # Delete source, skip rename
                         print(f"Deleting source directory: {old_path}")
-                        shutil.rmtree(old_path)
+                        _delete_directory(old_path, trash)
                         print(f"Kept existing destination: {new_path}")
                         continue
                 else:
@@ -624,8 +961,15 @@ def normalize_directories(
                     continue
 
             os.rename(old_path, new_path)
+            invalidate_directory_size(old_path)
+            invalidate_directory_size(new_path)
             orig_highlighted, new_highlighted = highlight_changes(dir_name, new_dir_name)
             print(f"  Before: {orig_highlighted}")
             print(f"  After : {new_highlighted}")
 
+    if normalize_profile is not None:
+        print("\nNormalization profile:")
+        for line in normalize_profile.format_report():
+            print(f"  {line}" if line else "")
+
     return all_success
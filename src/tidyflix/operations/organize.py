@@ -13,6 +13,7 @@ from pathlib import Path
 
 from tidyflix.core.config import MEDIA_EXTENSIONS
 from tidyflix.core.models import Colors
+from tidyflix.core.utils import invalidate_directory_size
 
 # Regex pattern to match TV show episode filenames (e.g., "S01E01", "S1E1", etc.)
 # Pattern matches: [whitespace or dot]S[1-2 digits]E[1-3 digits][whitespace or dot]
@@ -127,6 +128,7 @@ def _organize_single_file(file_path: Path, dry_run: bool) -> bool:
         # Move the file to the destination directory
         print(f"  {Colors.GREEN}Moving:{Colors.RESET} {file_path.name} -> {destination_dir}")
         shutil.move(str(file_path), str(destination_file))
+        invalidate_directory_size(str(file_path.parent))
         return True
 
     except (OSError, shutil.Error) as e:
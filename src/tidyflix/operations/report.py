@@ -0,0 +1,167 @@
+"""
+Non-interactive duplicate reports.
+
+This module scans duplicate groups without prompting and writes each scored
+group as JSON, CSV or newline-delimited JSON as soon as it is complete, so
+duplicate detection can run headless over a whole library.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import sys
+from typing import Any, TextIO
+
+from tidyflix.analysis.media_probe import DirectoryProbe
+from tidyflix.analysis.subtitle_analyzer import get_subtitle_languages
+from tidyflix.analysis.video_analyzer import calculate_relative_size_scores
+from tidyflix.core.config import DEFAULT_SCAN_JOBS, REPORT_FORMATS
+from tidyflix.core.models import DuplicateGroup
+from tidyflix.processing.background_scanner import iter_scanned_groups
+
+CSV_COLUMNS = [
+    "group",
+    "rank",
+    "keep",
+    "name",
+    "path",
+    "source_dir",
+    "size_bytes",
+    "tags",
+    "tag_score",
+    "score",
+    "delta",
+    "external_subtitles",
+    "embedded_subtitles",
+]
+
+
+def group_to_record(
+    group: DuplicateGroup, language_filter: list[str] | None = None
+) -> dict[str, Any]:
+    """
+    Score a duplicate group and describe it as a JSON-serializable dict.
+
+    Directories are listed best first; the first one is the recommended keeper.
+    Subtitles are plain language codes (never the colored display summary),
+    restricted to language_filter when given.
+    """
+    group_scores = calculate_relative_size_scores(group.directories)
+    directories: list[dict[str, Any]] = []
+    for rank, index in enumerate(group_scores.ranking, 1):
+        dir_info = group.directories[index]
+        # Probes are memoized from the scan, so this reads no media files again
+        probe = dir_info.probe if dir_info.probe is not None else DirectoryProbe(dir_info.abs_path)
+        external, embedded = get_subtitle_languages(probe, language_filter)
+        directories.append(
+            {
+                "rank": rank,
+                "name": dir_info.name,
+                "path": dir_info.abs_path,
+                "source_dir": dir_info.source_dir,
+                "size_bytes": dir_info.size_bytes,
+                "tags": [tag.name for tag in dir_info.tags or []],
+                "tag_score": dir_info.tag_score,
+                "score": group_scores.scores[index],
+                "delta": group_scores.deltas[index],
+                "external_subtitles": external,
+                "embedded_subtitles": embedded,
+            }
+        )
+    return {
+        "group": group.prefix,
+        "keep": directories[0]["path"] if directories else None,
+        "directories": directories,
+    }
+
+
+class DuplicateReportWriter:
+    """Stream duplicate group records to a text stream in one of REPORT_FORMATS."""
+
+    def __init__(self, fmt: str, out: TextIO, language_filter: list[str] | None = None):
+        """
+        Initialize a DuplicateReportWriter object.
+
+        Args:
+            fmt: Output format, one of REPORT_FORMATS
+            out: Stream the report is written to
+            language_filter: Subtitle languages to include (default: all)
+        """
+        if fmt not in REPORT_FORMATS:
+            raise ValueError(f"Unknown report format: {fmt}")
+        self.fmt: str = fmt
+        self.out: TextIO = out
+        self.language_filter: list[str] | None = language_filter
+        self.group_count: int = 0
+        self._csv: Any = None
+
+        if fmt == "csv":
+            self._csv = csv.writer(out)
+            self._csv.writerow(CSV_COLUMNS)
+        elif fmt == "json":
+            out.write("[")
+
+    def write_group(self, group: DuplicateGroup) -> None:
+        """Score a group and write its record, flushing so consumers see it right away."""
+        record = group_to_record(group, self.language_filter)
+        if self.fmt == "csv":
+            for directory in record["directories"]:
+                self._csv.writerow(
+                    [
+                        record["group"],
+                        directory["rank"],
+                        int(directory["path"] == record["keep"]),
+                        directory["name"],
+                        directory["path"],
+                        directory["source_dir"],
+                        directory["size_bytes"],
+                        ";".join(directory["tags"]),
+                        directory["tag_score"],
+                        directory["score"],
+                        directory["delta"],
+                        ";".join(directory["external_subtitles"]),
+                        ";".join(directory["embedded_subtitles"]),
+                    ]
+                )
+        elif self.fmt == "json":
+            self.out.write(",\n" if self.group_count else "\n")
+            self.out.write(json.dumps(record))
+        else:
+            self.out.write(json.dumps(record) + "\n")
+        self.group_count += 1
+        self.out.flush()
+
+    def close(self) -> None:
+        """Finish the report (closes the JSON array)."""
+        if self.fmt == "json":
+            self.out.write("\n]\n" if self.group_count else "]\n")
+        self.out.flush()
+
+
+def report_duplicates(
+    target_directories: list[str],
+    fmt: str,
+    language_filter: list[str] | None = None,
+    jobs: int = DEFAULT_SCAN_JOBS,
+    out: TextIO | None = None,
+) -> int:
+    """
+    Scan all duplicate groups and write a machine-readable report.
+
+    Args:
+        target_directories: Library roots to search for duplicates
+        fmt: Output format, one of REPORT_FORMATS
+        language_filter: Subtitle languages to include (default: all)
+        jobs: Number of directories to scan in parallel
+        out: Stream to write to (default: sys.stdout)
+
+    Returns the number of duplicate groups reported.
+    """
+    writer = DuplicateReportWriter(fmt, out if out is not None else sys.stdout, language_filter)
+    try:
+        for group in iter_scanned_groups(target_directories, language_filter, jobs):
+            writer.write_group(group)
+    finally:
+        writer.close()
+    return writer.group_count
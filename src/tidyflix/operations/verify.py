@@ -8,19 +8,34 @@ from __future__ import annotations
 
 import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 
 from tidyflix.analysis.subtitle_analyzer import is_media_file
+from tidyflix.core.config import DEFAULT_VERIFY_JOBS
+from tidyflix.core.library_index import get_library_index
 from tidyflix.core.models import Colors
-from tidyflix.core.utils import validate_directory
+from tidyflix.core.utils import invalidate_directory_size, validate_directory
 
 
-def verify_directories_have_media(target_directories: list[str], delete: bool = False) -> bool:
+class DirectoryVerdict:
+    """Result of classifying a directory tree for verification."""
+
+    def __init__(self):
+        self.has_media: bool = False
+        self.has_archives: bool = False
+        self.is_empty: bool = True  # No files anywhere in the tree
+
+
+def verify_directories_have_media(
+    target_directories: list[str], delete: bool = False, jobs: int = DEFAULT_VERIFY_JOBS
+) -> bool:
     """
     Verify that each subdirectory has at least one media file recursively.
 
     Args:
         target_directories: List of directories to verify
         delete: If True, delete directories that don't contain media files
+        jobs: Number of subdirectories to classify in parallel
 
     Returns True if all directories pass verification, False if any issues are found.
     """
@@ -38,7 +53,7 @@ def verify_directories_have_media(target_directories: list[str], delete: bool =
 
         print(f"\n{Colors.CYAN}Verifying directory: {validated_target_directory}{Colors.RESET}")
 
-        checked, empty, warnings = _process_directory(validated_target_directory, delete)
+        checked, empty, warnings = _process_directory(validated_target_directory, delete, jobs)
         total_checked += checked
         total_empty += empty
         total_warnings += warnings
@@ -65,13 +80,19 @@ def verify_directories_have_media(target_directories: list[str], delete: bool =
     return all_success
 
 
-def _process_directory(root_path: str, delete: bool = False) -> tuple[int, int, int]:
+def _process_directory(
+    root_path: str, delete: bool = False, jobs: int = DEFAULT_VERIFY_JOBS
+) -> tuple[int, int, int]:
     """
     Verify immediate subdirectories for media files.
 
+    Subdirectories are classified concurrently by a pool of jobs threads; results
+    are reported (and deletions performed) in sorted order as they become ready.
+
     Args:
         root_path: Root directory to verify
         delete: If True, delete directories that don't contain media files
+        jobs: Number of subdirectories to classify in parallel
 
     Returns (total_checked, empty_count, warning_count) tuple.
     """
@@ -79,57 +100,76 @@ def _process_directory(root_path: str, delete: bool = False) -> tuple[int, int,
     empty_count = 0
     warning_count = 0
 
-    try:
-        # Get only immediate subdirectories
-        immediate_subdirs = [
-            item for item in os.listdir(root_path) if os.path.isdir(os.path.join(root_path, item))
-        ]
-    except (PermissionError, OSError):
+    # Get only immediate subdirectories
+    listing = get_library_index().listing(root_path)
+    if listing is None:
         print(f"  {Colors.RED}✗ Cannot access directory{Colors.RESET}")
         return 0, 0, 0
+    immediate_subdirs = listing.dirs
 
     if not immediate_subdirs:
         print(f"  {Colors.YELLOW}No subdirectories found{Colors.RESET}")
         return 0, 0, 0
 
-    for subdir_name in sorted(immediate_subdirs):
-        subdir_path = os.path.join(root_path, subdir_name)
-        checked_count += 1
-
-        # Check if this subdirectory contains archive files
-        has_archives = _has_archive_files_recursive(subdir_path)
-
-        # Check if this subdirectory (and its contents) has any media files
-        has_media = _has_media_files_recursive(subdir_path)
-
-        if has_archives and has_media:
-            print(f"  {Colors.YELLOW}⚠ Contains archives: {subdir_name}{Colors.RESET}")
-            warning_count += 1
-
-        if not has_media:
-            if delete:
-                try:
-                    shutil.rmtree(subdir_path)
-                    if has_archives:
-                        print(
-                            f"  {Colors.RED}✗ Deleted (only archives): {subdir_name}{Colors.RESET}"
-                        )
-                    else:
-                        print(f"  {Colors.RED}✗ Deleted: {subdir_name}{Colors.RESET}")
-                    empty_count += 1
-                except OSError as e:
-                    print(f"  {Colors.RED}✗ Failed to delete {subdir_name}: {e}{Colors.RESET}")
-                    empty_count += 1
-            else:
+    subdir_names = sorted(immediate_subdirs)
+    subdir_paths = [os.path.join(root_path, name) for name in subdir_names]
+
+    with ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="tidyflix-verify") as executor:
+        # map() yields verdicts in submission order, keeping the output sorted
+        verdicts = executor.map(_classify_directory, subdir_paths)
+        for subdir_name, subdir_path, verdict in zip(
+            subdir_names, subdir_paths, verdicts, strict=True
+        ):
+            checked_count += 1
+            warnings, empty = _report_verdict(subdir_name, subdir_path, verdict, delete)
+            warning_count += warnings
+            empty_count += empty
+
+    return checked_count, empty_count, warning_count
+
+
+def _report_verdict(
+    subdir_name: str, subdir_path: str, verdict: DirectoryVerdict, delete: bool
+) -> tuple[int, int]:
+    """
+    Print the verification result for one subdirectory, deleting it if requested.
+
+    Returns (warning_count, empty_count) contributed by this subdirectory.
+    """
+    warning_count = 0
+    empty_count = 0
+    has_archives = verdict.has_archives
+    has_media = verdict.has_media
+
+    if has_archives and has_media:
+        print(f"  {Colors.YELLOW}⚠ Contains archives: {subdir_name}{Colors.RESET}")
+        warning_count += 1
+
+    if not has_media:
+        if delete:
+            try:
+                shutil.rmtree(subdir_path)
+                invalidate_directory_size(subdir_path)
                 if has_archives:
-                    print(
-                        f"  {Colors.RED}✗ No media files (has archives): {subdir_name}{Colors.RESET}"
-                    )
+                    print(f"  {Colors.RED}✗ Deleted (only archives): {subdir_name}{Colors.RESET}")
+                elif verdict.is_empty:
+                    print(f"  {Colors.RED}✗ Deleted (empty): {subdir_name}{Colors.RESET}")
                 else:
-                    print(f"  {Colors.RED}✗ No media files: {subdir_name}{Colors.RESET}")
+                    print(f"  {Colors.RED}✗ Deleted: {subdir_name}{Colors.RESET}")
                 empty_count += 1
+            except OSError as e:
+                print(f"  {Colors.RED}✗ Failed to delete {subdir_name}: {e}{Colors.RESET}")
+                empty_count += 1
+        else:
+            if has_archives:
+                print(f"  {Colors.RED}✗ No media files (has archives): {subdir_name}{Colors.RESET}")
+            elif verdict.is_empty:
+                print(f"  {Colors.RED}✗ No media files (empty): {subdir_name}{Colors.RESET}")
+            else:
+                print(f"  {Colors.RED}✗ No media files: {subdir_name}{Colors.RESET}")
+            empty_count += 1
 
-    return checked_count, empty_count, warning_count
+    return warning_count, empty_count
 
 
 def _has_media_files_recursive(directory_path: str) -> bool:
@@ -142,13 +182,8 @@ def _has_media_files_recursive(directory_path: str) -> bool:
     Returns True if any media files are found recursively, False otherwise.
     """
     try:
-        for _root, _dirs, files in os.walk(directory_path):
-            if any(
-                is_media_file(file)
-                or file.lower().endswith(".iso")
-                or file.lower().endswith(".bdmv")
-                for file in files
-            ):
+        for _root, _dirs, files in get_library_index().walk(directory_path):
+            if any(_is_media_entry(file) for file in files):
                 return True
     except (PermissionError, OSError):
         # If we can't access the directory, assume it's problematic
@@ -157,33 +192,54 @@ def _has_media_files_recursive(directory_path: str) -> bool:
     return False
 
 
-def _has_archive_files_recursive(directory_path: str) -> bool:
+def _is_media_entry(filename: str) -> bool:
+    """Check if a file counts as media for verification (including disc images)."""
+    file_lower = filename.lower()
+    return is_media_file(filename) or file_lower.endswith(".iso") or file_lower.endswith(".bdmv")
+
+
+def _is_archive_entry(filename: str, is_subs_dir: bool) -> bool:
+    """Check if a file is a release archive (par2, or rar outside subtitle directories)."""
+    file_lower = filename.lower()
+    if file_lower.endswith(".par2"):
+        # Always consider par2 files as archives
+        return True
+    # Only consider rar files as archives if not in a subs directory
+    return file_lower.endswith(".rar") and not is_subs_dir
+
+
+def _classify_directory(directory_path: str) -> DirectoryVerdict:
     """
-    Check if a directory or any of its subdirectories contains archive files (rar, par2).
+    Determine media, archive and empty status of a directory tree in one walk.
 
-    Excludes .rar files in directories containing "subs" (case-insensitive) as these
-    are typically subtitle archives.
+    Archives are .par2 files and .rar files outside directories whose path contains
+    "subs" or "subtitles" (case-insensitive), as those are typically subtitle
+    archives. The walk stops as soon as both media and archives have been found.
 
     Args:
         directory_path: Path to the directory to check
 
-    Returns True if any archive files are found recursively, False otherwise.
+    Returns a DirectoryVerdict; unreadable directories are treated as empty.
     """
+    verdict = DirectoryVerdict()
     try:
-        for root, _dirs, files in os.walk(directory_path):
-            # Check if current directory path contains "subs" (case-insensitive)
-            is_subs_dir = "subs" in root.lower() or "subtitles" in root.lower()
-
-            for file in files:
-                file_lower = file.lower()
-                if file_lower.endswith(".par2"):
-                    # Always consider par2 files as archives
-                    return True
-                elif file_lower.endswith(".rar") and not is_subs_dir:
-                    # Only consider rar files as archives if not in a subs directory
-                    return True
+        for root, _dirs, files in get_library_index().walk(directory_path):
+            if not files:
+                continue
+            verdict.is_empty = False
+
+            if not verdict.has_media:
+                verdict.has_media = any(_is_media_entry(file) for file in files)
+
+            if not verdict.has_archives:
+                # Check if current directory path contains "subs" (case-insensitive)
+                is_subs_dir = "subs" in root.lower() or "subtitles" in root.lower()
+                verdict.has_archives = any(_is_archive_entry(file, is_subs_dir) for file in files)
+
+            if verdict.has_media and verdict.has_archives:
+                break
     except (PermissionError, OSError):
-        # If we can't access the directory, assume it doesn't have archives
-        return False
+        # If we can't access the directory, assume it's problematic
+        pass
 
-    return False
+    return verdict
@@ -7,17 +7,62 @@ and produces ready duplicate groups for processing.
 
 from __future__ import annotations
 
+import bisect
 import queue
+import sys
 import threading
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 
+from tidyflix.core.config import DEFAULT_SCAN_JOBS, DEFAULT_SCAN_LOOKAHEAD
 from tidyflix.core.models import DirectoryInfo, DuplicateGroup
 from tidyflix.filesystem.scanner import scan_directory_info
-from tidyflix.processing.duplicate_detector import parse_prefix
+from tidyflix.processing.duplicate_detector import (
+    DuplicateDiscovery,
+    group_sort_key,
+    parse_prefix,
+)
+
+
+class _PendingGroup:
+    """Scheduling state for a duplicate group that has not been queued yet."""
+
+    def __init__(self, key: str, directories: list[DirectoryInfo]):
+        self.key: str = key
+        self.directories: list[DirectoryInfo] = directories
+        self.next_index: int = 0  # Next directory to hand to a worker
+        self.done_count: int = 0
+        self.scanned: list[DirectoryInfo] = []
+
+    @property
+    def complete(self) -> bool:
+        return self.done_count == len(self.directories)
 
 
 class BackgroundScanner:
-    """Handles background scanning of directories and produces ready duplicate groups."""
+    """
+    Handles background scanning of directories and produces ready duplicate groups.
+
+    Directories are scanned by a pool of worker threads. Scanning is dominated by
+    filesystem I/O and MediaInfo parsing, both of which release the GIL, so threads
+    give real parallelism here.
+
+    Groups are scheduled in the order the interactive UI presents them (see
+    group_sort_key): workers always pick the next unscanned directory of the
+    earliest pending group. Complete groups are queued strictly in that order.
+
+    A consumer that shows groups one at a time reports the index of the group on
+    screen with set_position(). Workers then only scan groups up to `lookahead`
+    groups after it and wait once they are that far ahead, so a user sitting on
+    a prompt does not keep the disks busy with groups they may never reach.
+    Until a position is reported, the window counts from the earliest group
+    that is not yet complete instead and never waits for the consumer. While
+    streaming discovery is still running no window is applied, since nothing
+    can be shown yet.
+
+    With streaming=True, directories are fed with add_directory() while
+    discovery is still running. They are scanned right away, but groups are
+    only queued after finish_discovery(), once their membership is final.
+    """
 
     def __init__(
         self,
@@ -25,71 +70,229 @@ class BackgroundScanner:
         ready_queue: queue.Queue[DuplicateGroup | None],
         progress_callback: Callable[[int, int], None] | None = None,
         language_filter: list[str] | None = None,
+        jobs: int = DEFAULT_SCAN_JOBS,
+        lookahead: int = DEFAULT_SCAN_LOOKAHEAD,
+        streaming: bool = False,
     ):
         self.directories_by_prefix: dict[str, list[DirectoryInfo]] = directories_by_prefix
         self.ready_queue: queue.Queue[DuplicateGroup | None] = ready_queue
         self.progress_callback: Callable[[int, int], None] | None = progress_callback
         self.language_filter: list[str] | None = language_filter
+        self.jobs: int = max(1, jobs)
+        self.lookahead: int = max(1, lookahead)
         self.scanned_count: int = 0
         self.total_count: int = sum(len(dirs) for dirs in directories_by_prefix.values())  # pyright: ignore[reportUnknownLambdaType]
         self.running: bool = True
-        self.thread: threading.Thread | None = None
+        self.finished: bool = False
+        self.discovery_complete: bool = not streaming
+        self.group_count: int = 0
+        self.queued_count: int = 0  # Groups put on ready_queue so far
+        self.position: int | None = None  # Index of the group the consumer is showing
+        self.error: Exception | None = None  # Unexpected worker failure, re-raised by consumers
+        self.threads: list[threading.Thread] = []
+        self._condition: threading.Condition = threading.Condition()
+        # Pending groups kept sorted by key; _pending_keys mirrors it for bisect
+        self._pending: list[_PendingGroup] = []
+        self._pending_keys: list[str] = []
+        self._pending_by_key: dict[str, _PendingGroup] = {}
 
     def start(self):
-        """Start the background scanning thread."""
-        self.thread = threading.Thread(target=self._scan_worker, daemon=True)
-        self.thread.start()
+        """Start the background scanning worker threads."""
+        with self._condition:
+            for prefix, dir_list in self.directories_by_prefix.items():
+                if dir_list:
+                    self._add_pending_locked(_PendingGroup(group_sort_key(prefix), dir_list))
+            self._release_ready_locked()
+
+        for i in range(self.jobs):
+            thread = threading.Thread(
+                target=self._scan_worker, name=f"tidyflix-scan-{i}", daemon=True
+            )
+            self.threads.append(thread)
+            thread.start()
 
     def stop(self):
         """Stop the background scanning."""
-        self.running = False
-        if self.thread:
-            self.thread.join(timeout=1.0)
+        with self._condition:
+            self.running = False
+            self._condition.notify_all()
+
+    def add_directory(self, prefix: str, dir_info: DirectoryInfo):
+        """Add a discovered directory to the group with the given key (streaming mode)."""
+        key = group_sort_key(prefix)
+        with self._condition:
+            pending = self._pending_by_key.get(key)
+            if pending is None:
+                self._add_pending_locked(_PendingGroup(key, [dir_info]))
+            else:
+                pending.directories.append(dir_info)
+            self.total_count += 1
+            self._condition.notify_all()
+
+    def finish_discovery(self):
+        """Mark discovery as complete so finished groups can be queued."""
+        with self._condition:
+            self.discovery_complete = True
+            self._release_ready_locked()
+            self._condition.notify_all()
+
+    def set_position(self, index: int):
+        """Report the index (in queue order) of the group the consumer is showing."""
+        with self._condition:
+            self.position = index
+            self._condition.notify_all()
 
     def get_progress(self) -> tuple[int, int]:
         """Get current scanning progress."""
         return self.scanned_count, self.total_count
 
+    def _add_pending_locked(self, pending: _PendingGroup):
+        """Insert a group into the schedule, keeping it ordered by key."""
+        index = bisect.bisect_right(self._pending_keys, pending.key)
+        self._pending_keys.insert(index, pending.key)
+        self._pending.insert(index, pending)
+        self._pending_by_key[pending.key] = pending
+        self.group_count += 1
+
+    def _next_task_locked(self) -> tuple[_PendingGroup, DirectoryInfo] | None:
+        """Pick the next directory to scan from the groups inside the lookahead window."""
+        if not self.discovery_complete:
+            # While discovery runs nothing can be queued yet, so don't limit how far ahead we go
+            window = self._pending
+        elif self.position is None:
+            window = self._pending[: self.lookahead]
+        else:
+            # Pending groups follow the queued ones, so pending[i] is group queued_count + i
+            window = self._pending[: max(0, self.position + self.lookahead + 1 - self.queued_count)]
+        for pending in window:
+            if pending.next_index < len(pending.directories):
+                dir_info = pending.directories[pending.next_index]
+                pending.next_index += 1
+                return pending, dir_info
+        return None
+
     def _scan_worker(self):
-        """Background worker that scans directories and produces ready groups."""
-        for prefix, dir_list in self.directories_by_prefix.items():
-            if not self.running:
-                break
-
-            # Scan all directories in this group
-            scanned_dirs: list[DirectoryInfo] = []
-            for dir_info in dir_list:
-                if not self.running:
-                    break
+        """Background worker that scans directories in presentation order."""
+        while True:
+            with self._condition:
+                task = self._next_task_locked()
+                while task is None and self.running and not self.finished:
+                    self._condition.wait()
+                    task = self._next_task_locked()
+                if task is None or not self.running:
+                    return
+
+            pending, dir_info = task
+            try:
+                scanned_dir: DirectoryInfo | None = scan_directory_info(
+                    dir_info, self.language_filter
+                )
+            except OSError as e:
+                print(f"Warning: Cannot scan directory {dir_info.abs_path}: {e}", file=sys.stderr)
+                scanned_dir = None
+            except Exception as e:
+                self._fail(e)
+                return
 
-                # Scan this directory
-                scanned_dir = scan_directory_info(dir_info, self.language_filter)
-                scanned_dirs.append(scanned_dir)
+            with self._condition:
+                if not self.running:
+                    return
+                if scanned_dir is not None:
+                    pending.scanned.append(scanned_dir)
+                pending.done_count += 1
                 self.scanned_count += 1
+                scanned_count = self.scanned_count
+                self._release_ready_locked()
+                self._condition.notify_all()
+
+            # Notify progress callback if provided
+            if self.progress_callback:
+                self.progress_callback(scanned_count, self.total_count)
+
+    def _fail(self, error: Exception):
+        """Stop scanning after an unexpected error and wake the consumer to re-raise it."""
+        with self._condition:
+            if self.error is None:
+                self.error = error
+            self.running = False
+            if not self.finished:
+                self.finished = True
+                self.ready_queue.put(None)
+            self._condition.notify_all()
+
+    def _release_ready_locked(self):
+        """Queue complete groups from the front of the schedule, in order."""
+        if not self.discovery_complete:
+            return
+
+        while self._pending and self._pending[0].complete:
+            pending = self._pending.pop(0)
+            self._pending_keys.pop(0)
+            del self._pending_by_key[pending.key]
+            self._queue_group(pending.key, pending.scanned)
+
+        if not self._pending and not self.finished:
+            self.finished = True
+            # Signal completion
+            self.ready_queue.put(None)
+
+    def _queue_group(self, prefix: str, scanned_dirs: list[DirectoryInfo]):
+        """Create and queue the complete duplicate group."""
+        if not scanned_dirs:
+            return
+
+        # Initial sort by size (largest first) - will be re-sorted by score later
+        scanned_dirs.sort(key=lambda x: x.size_bytes or 0, reverse=True)  # pyright: ignore[reportUnknownLambdaType]
+
+        # Extract original prefix from first directory for display
+        # The prefix parameter is normalized (lowercase), but we want the original capitalization
+        original_prefix = parse_prefix(scanned_dirs[0].name)
+        # Fallback to normalized prefix if parse_prefix returns None (shouldn't happen)
+        display_prefix = original_prefix if original_prefix else prefix
+
+        group = DuplicateGroup(display_prefix, scanned_dirs)
+        group.calculate_size_info()
+
+        # Put the ready group in the queue
+        self.queued_count += 1
+        self.ready_queue.put(group)
 
-                # Notify progress callback if provided
-                if self.progress_callback:
-                    self.progress_callback(self.scanned_count, self.total_count)
 
-            if not self.running:
-                break
+def feed_discovery(discovery: DuplicateDiscovery, scanner: BackgroundScanner):
+    """Stream discovered duplicate candidates into a streaming background scanner."""
+    try:
+        for key, dir_info in discovery:
+            if not scanner.running:
+                return
+            scanner.add_directory(key, dir_info)
+    finally:
+        scanner.finish_discovery()
 
-            # Create and queue the complete duplicate group
-            if scanned_dirs:
-                # Initial sort by size (largest first) - will be re-sorted by score later
-                scanned_dirs.sort(key=lambda x: x.size_bytes or 0, reverse=True)  # pyright: ignore[reportUnknownLambdaType]
 
-                # Extract original prefix from first directory for display
-                # The prefix parameter is normalized (lowercase), but we want the original capitalization
-                original_prefix = parse_prefix(scanned_dirs[0].name)
-                # Fallback to normalized prefix if parse_prefix returns None (shouldn't happen)
-                display_prefix = original_prefix if original_prefix else prefix
+def iter_scanned_groups(
+    target_dirs: list[str],
+    language_filter: list[str] | None = None,
+    jobs: int = DEFAULT_SCAN_JOBS,
+) -> Iterator[DuplicateGroup]:
+    """
+    Discover and scan duplicate groups, yielding each one as soon as it is complete.
 
-                group = DuplicateGroup(display_prefix, scanned_dirs)
-                group.calculate_size_info()
+    Meant for consumers that do not wait for a human: the scanner is not held
+    back by a lookahead window. Stopping the iteration stops the scanner.
+    """
+    ready_queue: queue.Queue[DuplicateGroup | None] = queue.Queue()
+    scanner = BackgroundScanner(
+        {}, ready_queue, None, language_filter, jobs, lookahead=sys.maxsize, streaming=True
+    )
+    scanner.start()
 
-                # Put the ready group in the queue
-                self.ready_queue.put(group)
+    discovery = DuplicateDiscovery(target_dirs)
+    threading.Thread(target=feed_discovery, args=(discovery, scanner), daemon=True).start()
 
-        # Signal completion
-        self.ready_queue.put(None)
+    try:
+        while (group := ready_queue.get()) is not None:
+            yield group
+        if scanner.error is not None:
+            raise scanner.error
+    finally:
+        scanner.stop()
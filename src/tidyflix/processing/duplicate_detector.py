@@ -7,8 +7,10 @@ based on naming patterns and year detection.
 
 import os
 import re
-from collections import defaultdict
+import sys
+from collections.abc import Iterator
 
+from tidyflix.core.library_index import get_library_index
 from tidyflix.core.models import Colors, DirectoryInfo
 
 
@@ -20,6 +22,67 @@ def parse_prefix(name: str) -> str | None:
     return None
 
 
+def group_sort_key(prefix: str) -> str:
+    """Return the key duplicate groups are scanned and presented in (case-insensitive)."""
+    return prefix.lower()
+
+
+class DuplicateDiscovery:
+    """
+    Streaming discovery of duplicate directories.
+
+    Iterating yields (group_key, DirectoryInfo) pairs as soon as a prefix bucket
+    reaches two members: the first member is held back until a second one shows
+    up, later members are yielded immediately. Library roots are listed through
+    the library index, so unchanged roots are not re-read from disk and
+    directory checks need no stat per entry. After iteration, `groups` holds
+    every duplicate group found.
+    """
+
+    def __init__(self, target_dirs: list[str]):
+        self.target_dirs: list[str] = target_dirs
+        self.total_directories: int = 0  # Directories with a parsable prefix
+        self.groups: dict[str, list[DirectoryInfo]] = {}
+
+    def __iter__(self) -> Iterator[tuple[str, DirectoryInfo]]:
+        # First member of each bucket, held until a duplicate shows up
+        singles: dict[str, DirectoryInfo] = {}
+
+        for target_dir in self.target_dirs:
+            abs_target_dir = os.path.abspath(target_dir)
+            try:
+                listing = get_library_index().read_listing(abs_target_dir)
+            except OSError as e:
+                print(f"Warning: Cannot access directory {target_dir}: {e}", file=sys.stderr)
+                continue
+
+            for name in listing.dirs:
+                prefix = parse_prefix(name)
+                if not prefix:
+                    continue
+
+                self.total_directories += 1
+                # Normalize to lowercase for case-insensitive grouping
+                key = group_sort_key(prefix)
+                dir_info = DirectoryInfo(
+                    name=name,
+                    abs_path=os.path.join(abs_target_dir, name),
+                    source_dir=abs_target_dir,
+                )
+
+                group = self.groups.get(key)
+                if group is not None:
+                    group.append(dir_info)
+                    yield key, dir_info
+                elif key in singles:
+                    first = singles.pop(key)
+                    self.groups[key] = [first, dir_info]
+                    yield key, first
+                    yield key, dir_info
+                else:
+                    singles[key] = dir_info
+
+
 def discover_duplicates(target_dirs: list[str]) -> dict[str, list[DirectoryInfo]]:
     """Phase 1: Quick discovery of directories and identification of duplicates."""
     print(
@@ -27,46 +90,21 @@ def discover_duplicates(target_dirs: list[str]) -> dict[str, list[DirectoryInfo]
     )
 
     # Collect all directories and group by prefix (lightweight pass)
-    # Use lowercase normalized prefix as key for case-insensitive grouping
-    prefix_groups: defaultdict[str, list[DirectoryInfo]] = defaultdict(list)
-
-    for target_dir in target_dirs:
-        abs_target_dir = os.path.abspath(target_dir)
-        try:
-            for item in os.listdir(target_dir):
-                item_path = os.path.join(target_dir, item)
-                if os.path.isdir(item_path):
-                    dir_info = DirectoryInfo(
-                        name=item, abs_path=os.path.abspath(item_path), source_dir=abs_target_dir
-                    )
-
-                    prefix = parse_prefix(dir_info.name)
-                    if prefix:
-                        # Normalize to lowercase for case-insensitive grouping
-                        normalized_prefix = prefix.lower()
-                        prefix_groups[normalized_prefix].append(dir_info)
-        except (PermissionError, OSError) as e:
-            print(f"Warning: Cannot access directory {target_dir}: {e}")
-            continue
-
-    # Filter to only groups with duplicates
-    # Return with normalized keys, but store original prefixes for later use
-    duplicate_groups: dict[str, list[DirectoryInfo]] = {
-        normalized_prefix: dlist
-        for normalized_prefix, dlist in prefix_groups.items()
-        if len(dlist) > 1
-    }
+    # Keys are lowercase normalized prefixes for case-insensitive grouping
+    discovery = DuplicateDiscovery(target_dirs)
+    for _ in discovery:
+        pass
+    duplicate_groups = discovery.groups
 
     if not duplicate_groups:
         print("No duplicates found.")
         return {}
 
     # Count directories for user info
-    total_dirs = sum(len(dlist) for dlist in prefix_groups.values())
     directories_to_scan = sum(len(dlist) for dlist in duplicate_groups.values())
 
     print(
-        f"Found {total_dirs} total directories, {directories_to_scan} need analysis ({len(duplicate_groups)} duplicates)."
+        f"Found {discovery.total_directories} total directories, {directories_to_scan} need analysis ({len(duplicate_groups)} duplicates)."
     )
     print(f"{Colors.CYAN}Starting background analysis and interactive processing...{Colors.RESET}")
 
@@ -0,0 +1,75 @@
+"""
+Automatic keeper selection for duplicate groups.
+
+This module decides which directory of a duplicate group to keep from an
+ordered list of rules, so groups can be resolved without prompting.
+"""
+
+from __future__ import annotations
+
+import os
+
+from tidyflix.analysis.video_analyzer import calculate_relative_size_scores
+from tidyflix.core.config import DEFAULT_KEEP_RULES, KEEP_RULES
+from tidyflix.core.models import DirectoryInfo
+
+
+class KeepPolicy:
+    """
+    Ordered rules for choosing the directory to keep in a duplicate group.
+
+    Rules are applied in order, each one only breaking ties left by the previous
+    ones:
+
+    - score: highest video_score (tags plus relative size)
+    - size: largest directory
+    - source: directory from the earliest library root given on the command line
+
+    Directories still tied after all rules are kept in scan order.
+    """
+
+    def __init__(self, rules: list[str], source_order: list[str] | None = None):
+        """
+        Initialize a KeepPolicy object.
+
+        Args:
+            rules: Rule names from KEEP_RULES, most important first
+            source_order: Library roots in order of preference for the source rule
+
+        Raises:
+            ValueError: If a rule is unknown or given twice
+        """
+        for rule in rules:
+            if rule not in KEEP_RULES:
+                raise ValueError(
+                    f"Unknown keep rule '{rule}' (choose from {', '.join(KEEP_RULES)})"
+                )
+        if len(set(rules)) != len(rules) or not rules:
+            raise ValueError("Keep rules must be a non-empty list without repeats")
+        self.rules: list[str] = rules
+        self.source_order: list[str] = [os.path.abspath(path) for path in source_order or []]
+
+    @classmethod
+    def parse(cls, spec: str, source_order: list[str] | None = None) -> KeepPolicy:
+        """Build a policy from a comma-separated rule list such as 'score,size,source'."""
+        rules = [rule.strip().lower() for rule in spec.split(",") if rule.strip()]
+        return cls(rules or list(DEFAULT_KEEP_RULES), source_order)
+
+    def choose(self, directories: list[DirectoryInfo]) -> int:
+        """Score the group and return the index of the directory to keep."""
+        calculate_relative_size_scores(directories)
+        return min(range(len(directories)), key=lambda i: self._sort_key(directories[i]))
+
+    def _sort_key(self, dir_info: DirectoryInfo) -> tuple[float, ...]:
+        """Key that is smallest for the preferred directory."""
+        key: list[float] = []
+        for rule in self.rules:
+            if rule == "score":
+                key.append(-(dir_info.video_score or 0))
+            elif rule == "size":
+                key.append(-(dir_info.size_bytes or 0))
+            elif dir_info.source_dir in self.source_order:
+                key.append(self.source_order.index(dir_info.source_dir))
+            else:
+                key.append(len(self.source_order))
+        return tuple(key)
@@ -79,6 +79,19 @@ def run_filenames():
         sys.argv = original_argv
 
 
+def run_purge():
+    """Run the trash purge process."""
+    from tidyflix.ui.cli import main_purge
+
+    # Remove the 'purge' subcommand from argv so purge's argparse works normally
+    original_argv = sys.argv[:]
+    sys.argv = [sys.argv[0]] + sys.argv[2:]
+    try:
+        main_purge()
+    finally:
+        sys.argv = original_argv
+
+
 def show_main_help():
     """Show the main help message with subcommand information."""
     print("""TidyFlix - Tidy your media collection by removing duplicates and cleaning up your files.
@@ -90,6 +103,7 @@ Usage:
   tidyflix organize [options]          # Organize media files into subdirectories
   tidyflix verify [options]            # Verify subdirectories contain media files
   tidyflix filenames [options]         # Rename main media files to match directory names
+  tidyflix purge [options]             # Permanently remove directories moved to trash
 
 Duplicate Detection (default):
   Find and manage duplicate movie directories with quality scoring.
@@ -101,12 +115,24 @@ Duplicate Detection (default):
     -h, --help               # Show this help message and exit
     -l, --languages LANG     # Comma-separated list of language codes to show in subtitle lists
                                (e.g. EN,FR,ES)
+    -j, --jobs N             # Number of directories to scan in parallel (default: 4)
+    --report FORMAT          # Write scored duplicate groups to stdout without prompting
+                               (json, csv or ndjson)
+    --keep                   # Resolve groups without prompting, keeping the directory
+                               preferred by --keep-by
+    --keep-by RULES          # Comma-separated rules for --keep: score, size, source
+                               (requires --keep; default: score,size,source)
+    -y, --yes                # Delete selected directories without asking for confirmation
+    --trash                  # Move deleted directories to .tidyflix-trash (see purge)
 
   Examples:
     tidyflix                          # Process current directory
     tidyflix /movies /movies-4k       # Process multiple directories
     tidyflix -l EN                    # Show only English subtitles
     tidyflix -l EN,FR /movies         # Show English and French subtitles
+    tidyflix -j 8 /mnt/nas/movies     # Scan 8 directories in parallel
+    tidyflix --report ndjson /movies  # Stream one JSON object per duplicate group
+    tidyflix --keep -y /movies        # Keep the best of every group and delete the rest
 
 Directory Normalization:
   Normalize directory names by removing unwanted substrings and applying standard formatting.
@@ -120,6 +146,8 @@ Directory Normalization:
   Options:
     --dry-run               # Show what would be renamed without actually doing it
     -e, --explain           # Show detailed steps of how each directory name is cleaned
+    --profile               # Show time spent in each normalizer at the end
+    --trash                 # Move directories deleted in conflicts to .tidyflix-trash
     --no-color              # Disable colored output
     -h, --help              # Show help for normalize subcommand
 
@@ -129,6 +157,7 @@ Directory Normalization:
     tidyflix normalize /movies /movies-4k  # Normalize directories in multiple paths
     tidyflix normalize --dry-run           # Preview changes without applying them
     tidyflix normalize -e                  # Show detailed cleaning steps
+    tidyflix normalize --dry-run --profile # Show which normalizers dominate
 
 File Cleaning:
   Clean unwanted files (.txt, .exe, and .url) from directories recursively.
@@ -181,6 +210,7 @@ Directory Verification:
 
   Options:
     --delete                # Delete directories that don't contain media files
+    -j, --jobs N            # Number of subdirectories to verify in parallel (default: 4)
     --no-color              # Disable colored output
     -h, --help              # Show help for verify subcommand
 
@@ -189,6 +219,7 @@ Directory Verification:
     tidyflix verify /movies             # Verify subdirectories in specified path
     tidyflix verify /movies /movies-4k  # Verify subdirectories in multiple paths
     tidyflix verify --delete            # Delete directories without media files
+    tidyflix verify -j 16 /mnt/nas      # Verify 16 subdirectories in parallel
 
 Filename Normalization:
   Rename main media files to match their parent directory names while preserving extensions.
@@ -210,12 +241,32 @@ Filename Normalization:
     tidyflix filenames /movies /movies-4k  # Rename files in multiple paths
     tidyflix filenames --dry-run           # Preview renames without doing them
 
+Trash Purge:
+  Permanently remove directories that --trash moved into .tidyflix-trash.
+
+  Usage:
+    tidyflix purge [options] [directories...]
+
+  Arguments:
+    directories             # Library roots whose trash is emptied (default: current directory)
+
+  Options:
+    --dry-run               # List the trash without removing anything
+    --no-color              # Disable colored output
+    -h, --help              # Show help for purge subcommand
+
+  Examples:
+    tidyflix purge                     # Empty the trash of the current directory
+    tidyflix purge /movies /movies-4k  # Empty the trash of multiple library roots
+    tidyflix purge --dry-run           # List what would be removed
+
 For more help on a specific subcommand:
   tidyflix normalize --help
   tidyflix clean --help
   tidyflix organize --help
   tidyflix verify --help
-  tidyflix filenames --help""")
+  tidyflix filenames --help
+  tidyflix purge --help""")
 
 
 def main():
@@ -231,6 +282,8 @@ def main():
         run_verify()
     elif len(sys.argv) > 1 and sys.argv[1] == "filenames":
         run_filenames()
+    elif len(sys.argv) > 1 and sys.argv[1] == "purge":
+        run_purge()
     elif len(sys.argv) > 1 and sys.argv[1] in ["-h", "--help"]:
         # Show main help with subcommand information
         show_main_help()
@@ -251,6 +304,9 @@ def main():
         elif len(sys.argv) > 2 and sys.argv[2] == "filenames":
             sys.argv = ["tidyflix", "filenames", "--help"]
             run_filenames()
+        elif len(sys.argv) > 2 and sys.argv[2] == "purge":
+            sys.argv = ["tidyflix", "purge", "--help"]
+            run_purge()
         else:
             show_main_help()
     else:
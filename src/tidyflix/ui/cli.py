@@ -10,15 +10,25 @@ import os
 import sys
 from dataclasses import dataclass
 
+from tidyflix.core.config import (
+    DEFAULT_KEEP_RULES,
+    DEFAULT_SCAN_JOBS,
+    DEFAULT_VERIFY_JOBS,
+    KEEP_RULES,
+    REPORT_FORMATS,
+    TRASH_DIR_NAME,
+)
 from tidyflix.core.models import Colors
 from tidyflix.filesystem.clean import clean_unwanted_files
-from tidyflix.operations.deletion import show_deletion_confirmation
+from tidyflix.operations.deletion import purge_trash, show_deletion_confirmation
 from tidyflix.operations.filenames import normalize_filenames
 from tidyflix.operations.normalize import normalize_directories
 from tidyflix.operations.organize import organize_media_files
+from tidyflix.operations.report import report_duplicates
 from tidyflix.operations.verify import verify_directories_have_media
-from tidyflix.processing.duplicate_detector import discover_duplicates
-from tidyflix.ui.interactive import process_with_background_scanning
+from tidyflix.processing.duplicate_detector import DuplicateDiscovery
+from tidyflix.processing.keep_policy import KeepPolicy
+from tidyflix.ui.interactive import process_with_background_scanning, process_with_keep_policy
 
 
 def should_use_colors() -> bool:
@@ -56,6 +66,12 @@ class DuplicateArgs(BaseCommandArgs):
     """Arguments for duplicate detection command."""
 
     languages: list[str] | None = None
+    jobs: int = DEFAULT_SCAN_JOBS
+    report: str | None = None
+    keep: bool = False
+    keep_by: str = ",".join(DEFAULT_KEEP_RULES)
+    auto_accept: bool = False
+    trash: bool = False
 
 
 @dataclass
@@ -64,6 +80,8 @@ class NormalizeArgs(BaseCommandArgs):
 
     dry_run: bool = False
     explain: bool = False
+    profile: bool = False
+    trash: bool = False
 
 
 @dataclass
@@ -85,6 +103,14 @@ class VerifyArgs(BaseCommandArgs):
     """Arguments for verify command."""
 
     delete: bool = False
+    jobs: int = DEFAULT_VERIFY_JOBS
+
+
+@dataclass
+class PurgeArgs(BaseCommandArgs):
+    """Arguments for purge command."""
+
+    dry_run: bool = False
 
 
 @dataclass
@@ -123,6 +149,11 @@ Examples:
   %(prog)s -l EN                     # Show only English subtitles
   %(prog)s -l EN,FR /movies          # Show only English and French subtitles
   %(prog)s --languages EN,FR /movies # Alternative syntax for multiple languages
+  %(prog)s -j 8 /mnt/nas/movies      # Scan 8 directories in parallel (slow network shares)
+  %(prog)s --report json /movies     # Write scored duplicate groups as JSON, no prompts
+  %(prog)s --keep /movies            # Keep the best of each group without prompting
+  %(prog)s --keep --keep-by size -y /a /b # Keep the largest copy, delete without confirming
+  %(prog)s --trash /movies           # Move deleted directories to trash (see 'tidyflix purge')
         """,
     )
 
@@ -140,10 +171,65 @@ Examples:
         help="Comma-separated list of language codes to show in subtitle lists (e.g., EN,FR,ES)",
     )
 
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        metavar="N",
+        type=int,
+        default=DEFAULT_SCAN_JOBS,
+        help=f"Number of directories to scan in parallel (default: {DEFAULT_SCAN_JOBS})",
+    )
+
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
+        "--report",
+        metavar="FORMAT",
+        choices=REPORT_FORMATS,
+        help=f"Write scored duplicate groups to stdout without prompting ({', '.join(REPORT_FORMATS)})",
+    )
+    mode.add_argument(
+        "--keep",
+        action="store_true",
+        help="Resolve every group automatically, keeping the directory preferred by --keep-by",
+    )
+
+    parser.add_argument(
+        "--keep-by",
+        metavar="RULES",
+        help=f"Comma-separated rules from {', '.join(KEEP_RULES)} for --keep, most important "
+        f"first; requires --keep (default: {','.join(DEFAULT_KEEP_RULES)})",
+    )
+
+    parser.add_argument(
+        "-y",
+        "--yes",
+        action="store_true",
+        help="Delete the directories selected for deletion without asking for confirmation",
+    )
+
+    parser.add_argument(
+        "--trash",
+        action="store_true",
+        help=f"Move deleted directories into {TRASH_DIR_NAME} instead of removing them",
+    )
+
     parser.add_argument("--no-color", action="store_true", help="Disable colored output")
 
     args = parser.parse_args()
 
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+
+    if args.keep_by is None:
+        args.keep_by = ",".join(DEFAULT_KEEP_RULES)
+    elif not args.keep:
+        parser.error("--keep-by requires --keep")
+
+    try:
+        KeepPolicy.parse(args.keep_by)
+    except ValueError as e:
+        parser.error(str(e))
+
     # Parse language filter
     language_filter = None
     if args.languages:
@@ -154,7 +240,15 @@ Examples:
             language_filter = [args.languages.upper()]
 
     return DuplicateArgs(
-        directories=args.directories, no_color=args.no_color, languages=language_filter
+        directories=args.directories,
+        no_color=args.no_color,
+        languages=language_filter,
+        jobs=args.jobs,
+        report=args.report,
+        keep=args.keep,
+        keep_by=args.keep_by,
+        auto_accept=args.yes,
+        trash=args.trash,
     )
 
 
@@ -170,6 +264,8 @@ Examples:
   %(prog)s /movies /movies-4k      # Normalize directories in multiple paths
   %(prog)s --dry-run               # Preview changes without applying them
   %(prog)s -e                      # Show detailed cleaning steps (with colors)
+  %(prog)s --dry-run --profile     # Show time spent in each normalizer
+  %(prog)s --trash                 # Move conflicting directories to trash instead of deleting
   %(prog)s --no-color              # Disable colored output
         """,
     )
@@ -194,6 +290,18 @@ Examples:
         help="Show detailed steps of how each operation is performed",
     )
 
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Print time and call counts per normalizer and per iteration at the end",
+    )
+
+    parser.add_argument(
+        "--trash",
+        action="store_true",
+        help=f"Move directories deleted to resolve conflicts into {TRASH_DIR_NAME}",
+    )
+
     parser.add_argument("--no-color", action="store_true", help="Disable colored output")
 
     args = parser.parse_args()
@@ -203,6 +311,8 @@ Examples:
         no_color=args.no_color,
         dry_run=args.dry_run,
         explain=args.explain,
+        profile=args.profile,
+        trash=args.trash,
     )
 
 
@@ -211,6 +321,11 @@ def main_duplicate():
     args = parse_duplicate_arguments()
     target_dirs = _validate_and_setup_common(args)
 
+    if args.report:
+        # Stdout carries only the report
+        report_duplicates(target_dirs, args.report, language_filter=args.languages, jobs=args.jobs)
+        return
+
     # Display processing info
     if len(target_dirs) == 1 and target_dirs[0] == ".":
         abs_target_dir = os.path.abspath(".")
@@ -221,17 +336,30 @@ def main_duplicate():
     if args.languages:
         print(f"{Colors.BOLD_BLUE}Language filter: {', '.join(args.languages)}{Colors.RESET}")
 
-    # Execute business logic
-    duplicate_groups_dict = discover_duplicates(target_dirs)
+    # Execute business logic: discovery streams candidates straight into background analysis
+    print(
+        f"\n{Colors.CYAN}Phase 1: Discovering directories and identifying duplicates...{Colors.RESET}"
+    )
+    if args.keep:
+        policy = KeepPolicy.parse(args.keep_by, source_order=target_dirs)
+        to_delete = process_with_keep_policy(
+            target_dirs, policy, language_filter=args.languages, jobs=args.jobs
+        )
+        show_deletion_confirmation(to_delete, auto_accept=args.auto_accept, trash=args.trash)
+        return
 
-    if not duplicate_groups_dict:
+    discovery = DuplicateDiscovery(target_dirs)
+    to_delete = process_with_background_scanning(
+        language_filter=args.languages, jobs=args.jobs, discovery=discovery
+    )
+
+    if not discovery.groups:
         print(
             f"\n{Colors.GREEN}No duplicates found. All directories appear to be unique.{Colors.RESET}"
         )
         return
 
-    to_delete = process_with_background_scanning(duplicate_groups_dict, args.languages)
-    show_deletion_confirmation(to_delete)
+    show_deletion_confirmation(to_delete, auto_accept=args.auto_accept, trash=args.trash)
 
 
 def main_normalize():
@@ -240,7 +368,11 @@ def main_normalize():
     target_dirs = _validate_and_setup_common(args)
 
     success = normalize_directories(
-        target_directories=target_dirs, dry_run=args.dry_run, explain=args.explain
+        target_directories=target_dirs,
+        dry_run=args.dry_run,
+        explain=args.explain,
+        profile=args.profile,
+        trash=args.trash,
     )
     if not success:
         sys.exit(1)
@@ -347,6 +479,7 @@ Examples:
   %(prog)s /movies                 # Verify subdirectories in specified path
   %(prog)s /movies /movies-4k      # Verify subdirectories in multiple paths
   %(prog)s --delete                # Delete directories without media files
+  %(prog)s -j 16 /mnt/nas/movies   # Verify 16 subdirectories in parallel
   %(prog)s --no-color              # Disable colored output
         """,
     )
@@ -364,11 +497,25 @@ Examples:
         help="Delete directories that don't contain media files",
     )
 
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        metavar="N",
+        type=int,
+        default=DEFAULT_VERIFY_JOBS,
+        help=f"Number of subdirectories to verify in parallel (default: {DEFAULT_VERIFY_JOBS})",
+    )
+
     parser.add_argument("--no-color", action="store_true", help="Disable colored output")
 
     args = parser.parse_args()
 
-    return VerifyArgs(directories=args.directories, no_color=args.no_color, delete=args.delete)
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+
+    return VerifyArgs(
+        directories=args.directories, no_color=args.no_color, delete=args.delete, jobs=args.jobs
+    )
 
 
 def main_verify():
@@ -376,7 +523,9 @@ def main_verify():
     args = parse_verify_arguments()
     target_dirs = _validate_and_setup_common(args)
 
-    success = verify_directories_have_media(target_directories=target_dirs, delete=args.delete)
+    success = verify_directories_have_media(
+        target_directories=target_dirs, delete=args.delete, jobs=args.jobs
+    )
     if not success:
         sys.exit(1)
 
@@ -424,3 +573,46 @@ def main_filenames():
     success = normalize_filenames(target_directories=target_dirs, dry_run=args.dry_run)
     if not success:
         sys.exit(1)
+
+
+def parse_purge_arguments() -> PurgeArgs:
+    """Parse command line arguments for purge command."""
+    parser = argparse.ArgumentParser(
+        description=f"Permanently remove directories moved to {TRASH_DIR_NAME} by --trash.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s                         # Empty the trash of the current directory
+  %(prog)s /movies /movies-4k      # Empty the trash of multiple library roots
+  %(prog)s --dry-run               # List the trash without removing anything
+        """,
+    )
+
+    parser.add_argument(
+        "directories",
+        nargs="*",
+        default=["."],
+        help="Library roots whose trash is emptied (default: current directory)",
+    )
+
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Show what would be removed without actually doing it",
+    )
+
+    parser.add_argument("--no-color", action="store_true", help="Disable colored output")
+
+    args = parser.parse_args()
+
+    return PurgeArgs(directories=args.directories, no_color=args.no_color, dry_run=args.dry_run)
+
+
+def main_purge():
+    """CLI entry point for purge command."""
+    args = parse_purge_arguments()
+    target_dirs = _validate_and_setup_common(args)
+
+    success = purge_trash(target_directories=target_dirs, dry_run=args.dry_run)
+    if not success:
+        sys.exit(1)
@@ -10,9 +10,17 @@ import sys
 import threading
 
 from tidyflix.analysis.video_analyzer import calculate_relative_size_scores
+from tidyflix.core.config import DEFAULT_SCAN_JOBS
 from tidyflix.core.models import Colors, DirectoryInfo, DuplicateGroup
 from tidyflix.filesystem.file_operations import copy_additional_subtitles
-from tidyflix.processing.background_scanner import BackgroundScanner
+from tidyflix.filesystem.scanner import get_directory_preview
+from tidyflix.processing.background_scanner import (
+    BackgroundScanner,
+    feed_discovery,
+    iter_scanned_groups,
+)
+from tidyflix.processing.duplicate_detector import DuplicateDiscovery, group_sort_key
+from tidyflix.processing.keep_policy import KeepPolicy
 from tidyflix.ui.display import get_size_color, list_directory_contents_cached
 
 
@@ -46,19 +54,13 @@ def process_duplicate_group(
     print(f"\n=== {Colors.CYAN}{duplicate_group.prefix}{Colors.RESET} ===")
     print()
 
-    directories = duplicate_group.directories
-
     # Calculate relative size scores within this group
-    calculate_relative_size_scores(directories)
-
-    # Sort by score (highest first) - this puts the best quality option first
-    directories.sort(key=lambda x: x.video_score if x.video_score is not None else 0, reverse=True)
+    group_scores = calculate_relative_size_scores(duplicate_group.directories)
 
-    # Calculate baseline score (lowest score in the group) for delta calculation
-    baseline_score = min(
-        (dir_info.video_score for dir_info in directories if dir_info.video_score is not None),
-        default=0,
-    )
+    # Order by score (highest first) - this puts the best quality option first
+    directories = [duplicate_group.directories[i] for i in group_scores.ranking]
+    deltas = [group_scores.deltas[i] for i in group_scores.ranking]
+    duplicate_group.directories[:] = directories
 
     # Display options
     for i, dir_info in enumerate(directories, 1):
@@ -68,11 +70,10 @@ def process_duplicate_group(
             duplicate_group.max_size_dir if duplicate_group.max_size_dir is not None else dir_info,
         )
 
-        # Display delta score if available and positive
+        # Display delta score (relative to the lowest score in the group) if positive
         score_display = ""
-        if dir_info.video_score is not None and dir_info.video_score > baseline_score:
-            delta_score = dir_info.video_score - baseline_score
-            score_display = f" {Colors.CYAN}(+{delta_score}){Colors.RESET}"
+        if deltas[i - 1] > 0:
+            score_display = f" {Colors.CYAN}(+{deltas[i - 1]}){Colors.RESET}"
 
         print(
             f"{color}{i}.{Colors.RESET} {dir_info.name:40s} {color}{dir_info.size_mb:10.2f} MB{Colors.RESET}{dir_info.video_tags}{score_display}"
@@ -86,7 +87,7 @@ def process_duplicate_group(
         if dir_info.subtitle_summary:
             print(f"   {Colors.BLUE}Subs: {dir_info.subtitle_summary}{Colors.RESET}")
 
-        list_directory_contents_cached(dir_info.contents or [])
+        list_directory_contents_cached(get_directory_preview(dir_info))
 
     # Handle user input
     while True:
@@ -135,9 +136,18 @@ def process_duplicate_group(
 
 
 def process_with_background_scanning(
-    duplicate_groups_dict: dict[str, list[DirectoryInfo]], language_filter: list[str] | None = None
+    duplicate_groups_dict: dict[str, list[DirectoryInfo]] | None = None,
+    language_filter: list[str] | None = None,
+    jobs: int = DEFAULT_SCAN_JOBS,
+    discovery: DuplicateDiscovery | None = None,
 ) -> list[str]:
-    """Process duplicates with background scanning and early interactive start."""
+    """
+    Process duplicates with background scanning and early interactive start.
+
+    Groups come either from a finished discover_duplicates() result or, when
+    discovery is given, are streamed into the scanner while the library roots
+    are still being listed.
+    """
 
     # Set up the queue for ready groups
     ready_queue: queue.Queue[DuplicateGroup | None] = queue.Queue()
@@ -153,15 +163,25 @@ def process_with_background_scanning(
     # Start background scanner
     print(f"\n{Colors.CYAN}Phase 2: Background analysis started...{Colors.RESET}")
     scanner = BackgroundScanner(
-        duplicate_groups_dict, ready_queue, progress_callback, language_filter
+        duplicate_groups_dict or {},
+        ready_queue,
+        progress_callback,
+        language_filter,
+        jobs,
+        streaming=discovery is not None,
     )
+    # Prefetch only the groups after the one on screen (the first until a group is shown)
+    scanner.set_position(0)
     scanner.start()
 
+    if discovery is not None:
+        threading.Thread(target=feed_discovery, args=(discovery, scanner), daemon=True).start()
+
     # Wait for first groups to be ready
     ready_groups: list[DuplicateGroup] = []
     processed_groups = 0
     to_delete: list[str] = []
-    total_groups = len(duplicate_groups_dict)
+    total_groups = scanner.group_count
     started_interactive = False
 
     print("Waiting for initial analysis to complete...")
@@ -176,6 +196,8 @@ def process_with_background_scanning(
                 break
 
             ready_groups.append(group)
+            # Groups are only queued once discovery has finished, so the count is final
+            total_groups = scanner.group_count
 
             # Start interactive processing when we have groups ready
             # Initial start: wait for at least 3 groups or 1 group for small collections
@@ -195,13 +217,18 @@ def process_with_background_scanning(
                     started_interactive = True
                     # Clear the progress line
                     print(f"\r{' ' * 60}\r", end="")
+                    if discovery is not None:
+                        print(
+                            f"Found {discovery.total_directories} total directories, {scanner.total_count} need analysis ({total_groups} duplicates)."
+                        )
 
-                # Sort groups alphabetically
-                ready_groups.sort(key=lambda g: g.prefix)  # pyright: ignore[reportUnknownLambdaType]
+                # Sort groups in the same order the scanner schedules them
+                ready_groups.sort(key=lambda g: group_sort_key(g.prefix))  # pyright: ignore[reportUnknownLambdaType]
 
                 # Process the ready groups
                 for group in ready_groups:
                     processed_groups += 1
+                    scanner.set_position(processed_groups - 1)
 
                     # Show progress with background status
                     scanned, total = scanner.get_progress()
@@ -231,14 +258,18 @@ def process_with_background_scanning(
                         flush=True,
                     )
 
+    if scanner.error is not None:
+        raise scanner.error
+
     # Process any remaining groups
     if ready_groups:
         # Clear any remaining progress output
         print(f"\r{' ' * 60}\r", end="")
 
-        ready_groups.sort(key=lambda g: g.prefix)  # pyright: ignore[reportUnknownLambdaType]
+        ready_groups.sort(key=lambda g: group_sort_key(g.prefix))  # pyright: ignore[reportUnknownLambdaType]
         for group in ready_groups:
             processed_groups += 1
+            scanner.set_position(processed_groups - 1)
             print(
                 f"\n{Colors.GREEN}Processing duplicate {processed_groups}/{total_groups} (final batch){Colors.RESET}"
             )
@@ -248,3 +279,35 @@ def process_with_background_scanning(
 
     scanner.stop()
     return to_delete
+
+
+def process_with_keep_policy(
+    target_dirs: list[str],
+    policy: KeepPolicy,
+    language_filter: list[str] | None = None,
+    jobs: int = DEFAULT_SCAN_JOBS,
+) -> list[str]:
+    """
+    Resolve every duplicate group with a keep policy instead of prompting.
+
+    Groups are resolved as soon as they are scanned. As in interactive mode,
+    subtitles missing from the kept directory are copied over from the others.
+    Returns the directories to delete, for a single confirmation at the end.
+    """
+    print(
+        f"\n{Colors.CYAN}Phase 2: Analyzing and resolving duplicates automatically...{Colors.RESET}"
+    )
+    to_delete: list[str] = []
+    group_count = 0
+    for group in iter_scanned_groups(target_dirs, language_filter, jobs):
+        group_count += 1
+        keep_index = policy.choose(group.directories)
+        kept = group.directories[keep_index]
+        print(
+            f"{Colors.CYAN}{group.prefix}{Colors.RESET}: keep {Colors.GREEN}{kept.name}{Colors.RESET}"
+            f" (score {kept.video_score or 0}), delete {len(group.directories) - 1}"
+        )
+        add_others_to_delete_list(group.directories, keep_index, to_delete)
+
+    print(f"\nResolved {group_count} duplicate groups ({', '.join(policy.rules)}).")
+    return to_delete
@@ -0,0 +1,15 @@
+"""Shared test configuration."""
+
+from __future__ import annotations
+
+import pytest
+
+# Mirrors tidyflix.core.config.CACHE_DISABLE_ENV; conftest is loaded before the
+# package is importable, so the name is repeated here.
+CACHE_DISABLE_ENV = "TIDYFLIX_NO_CACHE"
+
+
+@pytest.fixture(autouse=True)
+def _disable_persistent_caches(monkeypatch: pytest.MonkeyPatch):  # pyright: ignore[reportUnusedFunction]
+    """Keep tests from reading or writing the user's on-disk caches."""
+    monkeypatch.setenv(CACHE_DISABLE_ENV, "1")
@@ -0,0 +1,186 @@
+"""Tests for background scanning of duplicate groups."""
+
+from __future__ import annotations
+
+import os
+import queue
+import tempfile
+
+import pytest
+
+from tidyflix.core.models import DirectoryInfo, DuplicateGroup
+from tidyflix.processing import background_scanner
+from tidyflix.processing.background_scanner import BackgroundScanner, iter_scanned_groups
+from tidyflix.processing.duplicate_detector import DuplicateDiscovery, discover_duplicates
+
+
+def _make_library(root: str, names: list[str]):
+    """Create movie directories with a small file in each."""
+    for name in names:
+        os.makedirs(os.path.join(root, name))
+        with open(os.path.join(root, name, "info.nfo"), "w") as f:
+            f.write(name)
+
+
+def _collect_groups(scanner_queue: queue.Queue[DuplicateGroup | None]) -> list[DuplicateGroup]:
+    """Drain the ready queue until the completion marker."""
+    groups: list[DuplicateGroup] = []
+    while True:
+        group = scanner_queue.get(timeout=10)
+        if group is None:
+            return groups
+        groups.append(group)
+
+
+def test_parallel_scan_queues_complete_groups():
+    """Every group is queued exactly once with all of its directories scanned."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        names: list[str] = []
+        for year in range(2000, 2010):
+            names.extend([f"Movie.{year}.720p", f"Movie.{year}.1080p", f"Movie {year} 2160p"])
+        _make_library(temp_dir, names)
+
+        duplicate_groups = discover_duplicates([temp_dir])
+        ready_queue: queue.Queue[DuplicateGroup | None] = queue.Queue()
+        scanner = BackgroundScanner(duplicate_groups, ready_queue, jobs=4)
+        scanner.start()
+
+        groups = _collect_groups(ready_queue)
+        scanner.stop()
+
+        assert len(groups) == 10
+        assert all(len(group.directories) == 3 for group in groups)
+        assert all(d.size_bytes is not None for group in groups for d in group.directories)
+        assert scanner.get_progress() == (30, 30)
+
+
+def test_scan_with_no_groups_signals_completion():
+    """An empty input immediately produces the completion marker."""
+    ready_queue: queue.Queue[DuplicateGroup | None] = queue.Queue()
+    scanner = BackgroundScanner({}, ready_queue, jobs=2)
+    scanner.start()
+    assert ready_queue.get(timeout=1) is None
+    scanner.stop()
+
+
+def test_groups_are_queued_in_presentation_order():
+    """Groups come out sorted by group key regardless of input order or lookahead."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        names: list[str] = []
+        for title in ["Zulu", "alpha", "Mike", "bravo", "Echo"]:
+            names.extend([f"{title}.1999.720p", f"{title}.1999.1080p"])
+        _make_library(temp_dir, names)
+
+        duplicate_groups = discover_duplicates([temp_dir])
+        # Feed groups in reverse order to make sure the scanner reorders them
+        reversed_groups = dict(reversed(list(duplicate_groups.items())))
+
+        for lookahead in (1, 16):
+            ready_queue: queue.Queue[DuplicateGroup | None] = queue.Queue()
+            scanner = BackgroundScanner(reversed_groups, ready_queue, jobs=3, lookahead=lookahead)
+            scanner.start()
+            groups = _collect_groups(ready_queue)
+            scanner.stop()
+
+            assert [g.prefix.split()[0].lower() for g in groups] == [
+                "alpha",
+                "bravo",
+                "echo",
+                "mike",
+                "zulu",
+            ]
+
+
+def test_streaming_scan_waits_for_discovery():
+    """Streamed groups include late members and are only queued after discovery ends."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        _make_library(
+            temp_dir, ["Movie.2001.720p", "Movie.2001.1080p", "Other.1990.a", "Other.1990.b"]
+        )
+        items = list(DuplicateDiscovery([temp_dir]))
+
+        ready_queue: queue.Queue[DuplicateGroup | None] = queue.Queue()
+        scanner = BackgroundScanner({}, ready_queue, jobs=2, streaming=True)
+        scanner.start()
+        for key, dir_info in items:
+            scanner.add_directory(key, dir_info)
+
+        # Nothing may be released until discovery is finished
+        try:
+            early = ready_queue.get(timeout=0.2)
+        except queue.Empty:
+            early = "empty"
+        assert early == "empty"
+
+        _make_library(temp_dir, ["Movie 2001 2160p"])
+        late = DuplicateDiscovery([temp_dir])
+        late_items = [item for item in late if item[1].name == "Movie 2001 2160p"]
+        scanner.add_directory(*late_items[0])
+        scanner.finish_discovery()
+
+        groups = _collect_groups(ready_queue)
+        scanner.stop()
+
+        assert [len(g.directories) for g in groups] == [3, 2]
+        assert scanner.group_count == 2
+
+
+def test_unreadable_directory_is_skipped_with_warning(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+):
+    """An OSError while scanning drops only that directory and names it on stderr."""
+    real_scan = background_scanner.scan_directory_info
+
+    def flaky_scan(dir_info: DirectoryInfo, language_filter: list[str] | None = None):
+        if dir_info.name == "Movie.2001.720p":
+            raise PermissionError("denied")
+        return real_scan(dir_info, language_filter)
+
+    monkeypatch.setattr(background_scanner, "scan_directory_info", flaky_scan)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        _make_library(temp_dir, ["Movie.2001.720p", "Movie.2001.1080p", "Movie 2001 2160p"])
+        groups = list(iter_scanned_groups([temp_dir], jobs=2))
+
+    assert [sorted(d.name for d in g.directories) for g in groups] == [
+        ["Movie 2001 2160p", "Movie.2001.1080p"]
+    ]
+    assert "Movie.2001.720p: denied" in capsys.readouterr().err
+
+
+def test_unexpected_scan_error_propagates(monkeypatch: pytest.MonkeyPatch):
+    """Programming errors in a worker are re-raised to the consumer instead of hanging it."""
+
+    def broken_scan(dir_info: DirectoryInfo, language_filter: list[str] | None = None):
+        raise RuntimeError("bug")
+
+    monkeypatch.setattr(background_scanner, "scan_directory_info", broken_scan)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        _make_library(temp_dir, ["Movie.2001.720p", "Movie.2001.1080p"])
+        with pytest.raises(RuntimeError, match="bug"):
+            list(iter_scanned_groups([temp_dir], jobs=2))
+
+
+def test_scanning_waits_for_consumer_position():
+    """Workers stop `lookahead` groups after the reported position until it advances."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        names: list[str] = []
+        for year in range(2000, 2006):
+            names.extend([f"Movie.{year}.720p", f"Movie.{year}.1080p"])
+        _make_library(temp_dir, names)
+
+        ready_queue: queue.Queue[DuplicateGroup | None] = queue.Queue()
+        scanner = BackgroundScanner(discover_duplicates([temp_dir]), ready_queue, lookahead=1)
+        scanner.set_position(0)
+        scanner.start()
+
+        # Showing group 0 allows groups 0 and 1 only
+        first = [ready_queue.get(timeout=10), ready_queue.get(timeout=10)]
+        with pytest.raises(queue.Empty):
+            ready_queue.get(timeout=0.3)
+        assert scanner.get_progress() == (4, 12)
+
+        scanner.set_position(4)
+        rest = _collect_groups(ready_queue)
+        scanner.stop()
+
+    assert [g.prefix for g in first + rest] == [f"Movie {year}" for year in range(2000, 2006)]
@@ -0,0 +1,29 @@
+"""Tests for batched directory deletion."""
+
+from __future__ import annotations
+
+import os
+import tempfile
+
+from tidyflix.operations.deletion import delete_directories
+
+
+def test_parallel_deletion_reports_freed_bytes_and_failures():
+    """Deleted trees count toward bytes freed; missing ones are reported as failures."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        paths: list[str] = []
+        for i in range(10):
+            path = os.path.join(temp_dir, f"Movie.{2000 + i}")
+            os.makedirs(os.path.join(path, "BDMV", "STREAM"))
+            with open(os.path.join(path, "BDMV", "STREAM", "00000.m2ts"), "wb") as f:
+                f.write(b"\0" * 100)
+            paths.append(path)
+        missing = os.path.join(temp_dir, "Missing.2010")
+        sizes = {path: 100 for path in paths}
+
+        summary = delete_directories([*paths, missing], sizes, jobs=4)
+
+        assert sorted(summary.deleted) == sorted(paths)
+        assert [path for path, _error in summary.failed] == [missing]
+        assert summary.bytes_freed == 1000
+        assert os.listdir(temp_dir) == []
@@ -5,7 +5,13 @@ from __future__ import annotations
 import os
 import tempfile
 
-from tidyflix.processing.duplicate_detector import discover_duplicates, parse_prefix
+import pytest
+
+from tidyflix.processing.duplicate_detector import (
+    DuplicateDiscovery,
+    discover_duplicates,
+    parse_prefix,
+)
 
 
 def test_parse_prefix():
@@ -124,3 +130,33 @@ def test_case_insensitive_duplicate_detection_with_dots():
 
         directories = duplicate_groups[group_key]
         assert len(directories) == 3
+
+
+def test_streaming_discovery_yields_only_duplicates():
+    """Streaming discovery yields members once a bucket has two, across target dirs."""
+    with tempfile.TemporaryDirectory() as first, tempfile.TemporaryDirectory() as second:
+        os.makedirs(os.path.join(first, "Some.Movie.2023.720p"))
+        os.makedirs(os.path.join(first, "Lonely.Movie.2001"))
+        os.makedirs(os.path.join(second, "Some Movie 2023 1080p"))
+        os.makedirs(os.path.join(second, "SOME.MOVIE.2023.2160p"))
+        with open(os.path.join(first, "Not.A.Dir.2023.mkv"), "w") as f:
+            f.write("x")
+
+        discovery = DuplicateDiscovery([first, second])
+        yielded = list(discovery)
+
+        assert {key for key, _ in yielded} == {"some movie 2023"}
+        assert len(yielded) == 3
+        assert discovery.total_directories == 4
+        assert [d.name for d in discovery.groups["some movie 2023"]] == [d.name for _, d in yielded]
+
+
+def test_unreadable_root_warning_includes_error(capsys: pytest.CaptureFixture[str]):
+    """A library root that cannot be listed is skipped with the OS error on stderr."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        missing = os.path.join(temp_dir, "missing")
+        assert discover_duplicates([missing]) == {}
+
+    err = capsys.readouterr().err
+    assert f"Warning: Cannot access directory {missing}: " in err
+    assert "No such file or directory" in err
@@ -0,0 +1,59 @@
+"""Tests for automatic keeper selection."""
+
+from __future__ import annotations
+
+import sys
+
+import pytest
+
+from tidyflix.core.models import DirectoryInfo
+from tidyflix.processing.keep_policy import KeepPolicy
+from tidyflix.ui.cli import parse_duplicate_arguments
+
+
+def _directory(name: str, source_dir: str, size_bytes: int, tag_score: int) -> DirectoryInfo:
+    dir_info = DirectoryInfo(name, f"{source_dir}/{name}", source_dir)
+    dir_info.size_bytes = size_bytes
+    dir_info.adjusted_size_mb = size_bytes / (1024 * 1024)
+    dir_info.tag_score = tag_score
+    return dir_info
+
+
+def _group() -> list[DirectoryInfo]:
+    return [
+        _directory("Small.Good", "/old", 100 * 1024 * 1024, 90),
+        _directory("Big.Plain", "/new", 400 * 1024 * 1024, 0),
+        _directory("Big.Plain.Copy", "/movies", 400 * 1024 * 1024, 0),
+    ]
+
+
+def test_rules_break_ties_in_order():
+    """Later rules only decide between directories tied on earlier ones."""
+    assert KeepPolicy.parse("score").choose(_group()) == 0
+    assert KeepPolicy.parse("size").choose(_group()) == 1
+    assert KeepPolicy.parse("size,source", ["/movies", "/new"]).choose(_group()) == 2
+    assert KeepPolicy.parse("source", ["/old"]).choose(_group()) == 0
+
+
+def test_default_rules():
+    """An empty specification falls back to the default rule order."""
+    assert KeepPolicy.parse("").rules == ["score", "size", "source"]
+
+
+@pytest.mark.parametrize("spec", ["score,bogus", "size,size"])
+def test_invalid_rules_are_rejected(spec: str):
+    with pytest.raises(ValueError):
+        KeepPolicy.parse(spec)
+
+
+def test_keep_by_requires_keep(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]):
+    """--keep-by on its own is rejected instead of being silently ignored."""
+    monkeypatch.setattr(sys, "argv", ["tidyflix", "--keep-by", "size", "/movies"])
+    with pytest.raises(SystemExit):
+        parse_duplicate_arguments()
+    assert "--keep-by requires --keep" in capsys.readouterr().err
+
+    monkeypatch.setattr(sys, "argv", ["tidyflix", "--keep", "--keep-by", "size", "/movies"])
+    assert parse_duplicate_arguments().keep_by == "size"
+    monkeypatch.setattr(sys, "argv", ["tidyflix", "--keep", "/movies"])
+    assert parse_duplicate_arguments().keep_by == "score,size,source"
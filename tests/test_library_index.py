@@ -0,0 +1,150 @@
+"""Tests for the persistent library index."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from tidyflix.core import library_index
+from tidyflix.core.cache import PersistentCache
+from tidyflix.core.config import CACHE_DISABLE_ENV
+from tidyflix.core.library_index import LibraryIndex
+
+OLD_MTIME_NS = 1_000_000_000_000_000_000
+
+
+def _age(path: Path, offset: int = 0):
+    """Give a directory an old mtime so its listing is cacheable."""
+    os.utime(path, ns=(OLD_MTIME_NS + offset, OLD_MTIME_NS + offset))
+
+
+def _build_tree(root: Path):
+    (root / "Movie.2020" / "Subs").mkdir(parents=True)
+    (root / "Movie.2020" / "movie.mkv").write_bytes(b"x" * 100)
+    (root / "Movie.2020" / "Subs" / "en.srt").write_bytes(b"x" * 10)
+    (root / "Empty").mkdir()
+    (root / "readme.txt").write_text("hi")
+    os.symlink(root / "Movie.2020", root / "Link.To.Movie")
+
+
+def test_walk_matches_os_walk(tmp_path: Path):
+    """The index walk reports the same tree as os.walk."""
+    _build_tree(tmp_path)
+    index = LibraryIndex()
+
+    def normalize(walk: list[tuple[str, list[str], list[str]]]):
+        return sorted((root, sorted(dirs), sorted(files)) for root, dirs, files in walk)
+
+    assert normalize(list(index.walk(str(tmp_path)))) == normalize(list(os.walk(tmp_path)))
+
+
+def test_listing_file_sizes(tmp_path: Path):
+    """Regular file sizes are summed per directory, symlinks are not followed."""
+    _build_tree(tmp_path)
+    index = LibraryIndex()
+    total = sum(listing.file_size for listing in index.iter_listings(str(tmp_path)))
+    assert total == 112
+
+
+def test_listing_reused_until_directory_changes(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """Persisted listings are served without reading the directory until its mtime changes."""
+    monkeypatch.delenv(CACHE_DISABLE_ENV, raising=False)
+    cache_dir = str(tmp_path / "cache")
+    library = tmp_path / "library"
+    library.mkdir()
+    (library / "a.mkv").write_bytes(b"x")
+    _age(library)
+
+    first = LibraryIndex(PersistentCache("library", directory=cache_dir))
+    listing = first.listing(str(library))
+    assert listing is not None and listing.files == ["a.mkv"]
+    cache = first._cache  # pyright: ignore[reportPrivateUsage]
+    assert cache is not None
+    cache.close()
+
+    def fail(path: str):
+        raise AssertionError(f"unexpected read of {path}")
+
+    monkeypatch.setattr(library_index, "_read_entries", fail)
+    second = LibraryIndex(PersistentCache("library", directory=cache_dir))
+    cached = second.listing(str(library))
+    assert cached is not None and cached.files == ["a.mkv"]
+
+    monkeypatch.undo()
+    monkeypatch.delenv(CACHE_DISABLE_ENV, raising=False)
+    (library / "b.mkv").write_bytes(b"x")
+    _age(library, offset=1)
+    changed = second.listing(str(library))
+    assert changed is not None and sorted(changed.files) == ["a.mkv", "b.mkv"]
+
+
+def test_persisted_listing_reads_current_file_sizes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    """A file that grows in place is sized correctly by a later run using the same cache."""
+    monkeypatch.delenv(CACHE_DISABLE_ENV, raising=False)
+    cache = PersistentCache("library", directory=str(tmp_path / "cache"))
+    library = tmp_path / "library"
+    library.mkdir()
+    (library / "a.mkv").write_bytes(b"x" * 100)
+    _age(library)
+
+    assert LibraryIndex(cache).stats(str(library)).size == 100
+
+    with open(library / "a.mkv", "ab") as f:
+        f.write(b"x" * 10_000_000)
+    _age(library)  # Appending leaves the directory mtime as it was
+
+    def fail(path: str):
+        raise AssertionError(f"unexpected read of {path}")
+
+    monkeypatch.setattr(library_index, "_read_entries", fail)
+    assert LibraryIndex(cache).stats(str(library)).size == 10_000_100
+
+
+def test_stats_match_walk(tmp_path: Path):
+    """Parallel stats count the same files, dirs and bytes as a sequential walk."""
+    _build_tree(tmp_path)
+    for i in range(20):
+        (tmp_path / "Empty" / f"sub{i}").mkdir()
+        (tmp_path / "Empty" / f"sub{i}" / "f.mkv").write_bytes(b"x" * i)
+    index = LibraryIndex()
+
+    stats = index.stats(str(tmp_path), max_workers=4)
+    walked = list(os.walk(tmp_path))
+    assert stats.file_count == sum(len(files) for _root, _dirs, files in walked)
+    assert stats.dir_count == sum(len(dirs) for _root, dirs, _files in walked)
+    assert stats.size == 112 + sum(range(20))
+
+
+def test_stats_deep_tree(tmp_path: Path):
+    """Deeply nested trees are walked to the bottom."""
+    depth = 200
+    path = tmp_path.joinpath(*["d"] * depth)
+    os.makedirs(path)
+    (path / "movie.mkv").write_bytes(b"x" * 7)
+
+    stats = LibraryIndex().stats(str(tmp_path))
+    assert (stats.size, stats.file_count, stats.dir_count) == (7, 1, depth)
+
+
+def test_memory_cache_is_bounded(tmp_path: Path):
+    """Only the most recently used listings are kept in memory."""
+    for i in range(10):
+        (tmp_path / f"d{i}").mkdir()
+    _age(tmp_path)
+    for i in range(10):
+        _age(tmp_path / f"d{i}")
+
+    index = LibraryIndex(memo_size=4)
+    assert index.stats(str(tmp_path)).dir_count == 10
+    memory = index._memory  # pyright: ignore[reportPrivateUsage]
+    assert len(memory) == 4
+
+    # A hit refreshes an entry, so it survives the next insertions
+    oldest = next(iter(memory))
+    index.listing(oldest)
+    index.listing(str(tmp_path))
+    assert oldest in memory
@@ -0,0 +1,130 @@
+"""Tests for the persistent cache and cached media probing."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from tidyflix.analysis import media_probe
+from tidyflix.analysis.media_probe import MediaProbe, probe_media_file
+from tidyflix.core.cache import PersistentCache
+from tidyflix.core.config import CACHE_DISABLE_ENV
+
+
+@pytest.fixture
+def cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> str:
+    """Enable on-disk caching in a temporary directory."""
+    monkeypatch.delenv(CACHE_DISABLE_ENV, raising=False)
+    return str(tmp_path / "cache")
+
+
+def test_persistent_cache_roundtrip(cache_dir: str):
+    """Values survive closing and reopening the cache."""
+    cache = PersistentCache("test", directory=cache_dir)
+    assert cache.enabled
+    cache.set("a", {"x": [1, 2]})
+    assert cache.get("a") == {"x": [1, 2]}
+    cache.close()
+
+    reopened = PersistentCache("test", directory=cache_dir)
+    assert reopened.get("a") == {"x": [1, 2]}
+    reopened.delete("a")
+    assert reopened.get("a") is None
+    reopened.close()
+
+
+def test_persistent_cache_version_change_drops_entries(cache_dir: str):
+    """Opening a namespace with a new version discards old entries."""
+    cache = PersistentCache("test", version=1, directory=cache_dir)
+    cache.set("a", 1)
+    cache.close()
+
+    upgraded = PersistentCache("test", version=2, directory=cache_dir)
+    assert upgraded.get("a") is None
+    upgraded.close()
+
+
+def test_persistent_cache_disabled_by_env(tmp_path: Path):
+    """The cache is a no-op when disabled through the environment."""
+    cache = PersistentCache("test", directory=str(tmp_path))
+    assert not cache.enabled
+    cache.set("a", 1)
+    assert cache.get("a") is None
+
+
+def test_probe_media_file_uses_cache(
+    cache_dir: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    """Unchanged files are parsed once; modified files are parsed again."""
+    monkeypatch.setattr(media_probe, "_probe_cache", PersistentCache("probes", directory=cache_dir))
+
+    calls: list[str] = []
+
+    def fake_parse(file_path: str) -> SimpleNamespace:
+        calls.append(file_path)
+        return SimpleNamespace(
+            tracks=[
+                SimpleNamespace(track_type="Video", codec_id="V_MPEGH/ISO/HEVC", format="HEVC"),
+                SimpleNamespace(track_type="Text", language="en", format="UTF-8"),
+            ]
+        )
+
+    monkeypatch.setattr(media_probe.MediaInfo, "parse", fake_parse)
+
+    movie = tmp_path / "movie.mkv"
+    movie.write_bytes(b"x" * 10)
+
+    first = probe_media_file(str(movie))
+    second = probe_media_file(str(movie))
+    assert isinstance(first, MediaProbe) and isinstance(second, MediaProbe)
+    assert second.video_codec == "V_MPEGH/ISO/HEVC"
+    assert second.text_tracks == [("en", "UTF-8")]
+    assert len(calls) == 1
+
+    movie.write_bytes(b"x" * 20)
+    os.utime(movie, ns=(0, 1))
+    probe_media_file(str(movie))
+    assert len(calls) == 2
+
+
+def test_probe_media_file_missing_file(tmp_path: Path):
+    """Missing files produce no probe."""
+    assert probe_media_file(str(tmp_path / "missing.mkv")) is None
+
+
+def test_scan_directory_info_parses_each_file_once(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """Codec detection, subtitles and relative scoring share one parse per file."""
+    from tidyflix.analysis.video_analyzer import calculate_relative_size_scores
+    from tidyflix.core.models import DirectoryInfo
+    from tidyflix.filesystem.scanner import scan_directory_info
+
+    calls: list[str] = []
+
+    def fake_parse(file_path: str) -> SimpleNamespace:
+        calls.append(file_path)
+        return SimpleNamespace(
+            tracks=[
+                SimpleNamespace(track_type="Video", codec_id="V_MPEGH/ISO/HEVC", format="HEVC"),
+                SimpleNamespace(track_type="Text", language="fi", format="PGS"),
+            ]
+        )
+
+    monkeypatch.setattr(media_probe.MediaInfo, "parse", fake_parse)
+
+    movie_dir = tmp_path / "Some.Movie.2020.1080p"
+    movie_dir.mkdir()
+    (movie_dir / "movie.mkv").write_bytes(b"x" * 10)
+    (movie_dir / "movie.en.srt").write_text("1")
+
+    dir_info = scan_directory_info(
+        DirectoryInfo(movie_dir.name, str(movie_dir), str(tmp_path)), None
+    )
+    calculate_relative_size_scores([dir_info])
+
+    assert len(calls) == 1
+    assert dir_info.video_tags is not None and "H265" in dir_info.video_tags
+    assert dir_info.subtitle_summary is not None
+    assert "FI" in dir_info.subtitle_summary and "EN" in dir_info.subtitle_summary
@@ -1,5 +1,10 @@
 from __future__ import annotations
 
+from pathlib import Path
+
+import pytest
+
+from tidyflix.core.config import CACHE_DISABLE_ENV
 from tidyflix.operations.normalize import (
     ColonRemovalNormalizer,
     DashDotNormalizer,
@@ -7,11 +12,15 @@ from tidyflix.operations.normalize import (
     EndBracketReplacementNormalizer,
     LeadingDotNormalizer,
     Normalize,
+    NormalizeMeta,
+    NormalizePipeline,
+    NormalizeProfile,
     ParensBracketsBracesNormalizer,
     SpaceReplacementNormalizer,
     SpecialDotPatternNormalizer,
     SubstringRemovalNormalizer,
     TermCapitalizer,
+    TermMover,
     TitleCaseNormalizer,
     TrailingCrapNormalizer,
     TrailingDotNormalizer,
@@ -541,3 +550,101 @@ def test_normalize_with_case_insensitive_filesystem_simulation():
 
             # Original directory should still exist
             assert os.path.exists(test_dir)
+
+
+def test_pipeline_is_built_once():
+    """Normalizers are instantiated once and reused across normalize_string calls."""
+    pipeline = Normalize.pipeline()
+    assert Normalize.pipeline() is pipeline
+    assert [type(n) for n in pipeline.normalizers] == NormalizeMeta.registry
+    assert pipeline.run("Movie Title (1999) [720p] [TGx]_..-") == "Movie.Title.1999.720p"
+
+
+def test_normalize_cached_persists_per_fingerprint(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """Cached results survive a new pipeline but not a change of normalizers."""
+    monkeypatch.delenv(CACHE_DISABLE_ENV, raising=False)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    name = "Movie Title (1999) [720p] [TGx]_..-"
+
+    first = NormalizePipeline(NormalizeMeta.registry)
+    assert first.normalize_cached(name) == "Movie.Title.1999.720p"
+    assert first._cache is not None  # pyright: ignore[reportPrivateUsage]
+    first._cache.close()  # pyright: ignore[reportPrivateUsage]
+
+    second = NormalizePipeline(NormalizeMeta.registry)
+    monkeypatch.setattr(second, "run", lambda text: pytest.fail("cache miss"))  # pyright: ignore[reportUnknownLambdaType]
+    assert second.normalize_cached(name) == "Movie.Title.1999.720p"
+    assert second._cache is not None  # pyright: ignore[reportPrivateUsage]
+    second._cache.close()  # pyright: ignore[reportPrivateUsage]
+
+    reduced = NormalizePipeline([SpaceReplacementNormalizer])
+    assert reduced.fingerprint != second.fingerprint
+    assert reduced.normalize_cached(name) == "Movie.Title.(1999).[720p].[TGx]...-"
+
+
+def test_normalize_many():
+    """Batch normalization yields ordered change records, in-process or in a process pool."""
+    names = ["Movie Title (1999) [720p] [TGx]_..-", "Clean.Movie.Title", "movie__hdtv__xvid"]
+
+    results = list(Normalize.normalize_many(names))
+    assert [r.original for r in results] == names
+    assert [r.normalized for r in results] == [
+        "Movie.Title.1999.720p",
+        "Clean.Movie.Title",
+        "Movie.HDTV.XviD",
+    ]
+    assert [r.changed for r in results] == [True, False, True]
+    assert "SubstringRemovalNormalizer" in results[0].applied
+    assert results[1].applied == []
+    assert results[2].applied == [
+        "SpaceReplacementNormalizer",
+        "DotCollapseNormalizer",
+        "TitleCaseNormalizer",
+        "TermCapitalizer",
+    ]
+
+    pooled = list(Normalize.normalize_many(names * 10, jobs=2))
+    assert [(r.normalized, r.applied) for r in pooled] == [
+        (r.normalized, r.applied) for r in results * 10
+    ]
+
+
+def test_fixpoint_skips_settled_normalizers():
+    """Normalizers that already left the current text unchanged are not rerun."""
+    count = len(NormalizeMeta.registry)
+
+    clean = Normalize.pipeline().trace("Clean.Movie.Title")
+    assert (clean.iterations, clean.invocations) == (1, count)
+
+    messy = Normalize.pipeline().trace("((Movie))  Title__[[2021]]")
+    assert messy.normalized == "Movie.Title.2021"
+    assert messy.iterations == 3
+    assert messy.invocations < messy.iterations * count
+
+
+def test_term_mover():
+    """Test TermMover moves release terms after the year, case-insensitively."""
+    normalizer = TermMover()
+
+    assert normalizer.normalize("Movie.EXTENDED.2019.1080p") == "Movie.2019.EXTENDED.1080p"
+    assert normalizer.normalize("Movie.Proper.Limited.2019") == "Movie.2019.Proper.Limited"
+    assert normalizer.normalize("Movie.2019.PROPER") == "Movie.2019.PROPER"
+    assert normalizer.normalize("Movie.Extended") == "Movie.Extended"
+
+
+def test_normalize_profile():
+    """Profiling records calls, changes and totals for every normalizer that ran."""
+    profile = NormalizeProfile()
+    pipeline = Normalize.pipeline()
+    pipeline.trace("Movie__Title[EtHD]  (2018)-.x265", profile=profile)
+    pipeline.trace("Clean.Movie.Title", profile=profile)
+
+    assert profile.names == 2
+    assert sum(profile.calls.values()) == profile.invocations
+    assert profile.changes["SubstringRemovalNormalizer"] == 1
+    assert sum(profile.iteration_calls) == profile.invocations
+    assert len(profile.iteration_calls) == 3
+    report = profile.format_report()
+    assert report[0].startswith("Normalizer")
+    assert any(line.startswith("Iteration") for line in report)
+    assert report[-1].startswith("2 names")
@@ -0,0 +1,116 @@
+"""Tests for the non-interactive duplicate report."""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+import os
+import tempfile
+from types import SimpleNamespace
+
+import pytest
+
+from tidyflix.analysis import media_probe
+from tidyflix.operations.report import report_duplicates
+
+
+def _make_library(root: str, sizes: dict[str, int]):
+    """Create movie directories holding a single file of the given size."""
+    for name, size in sizes.items():
+        os.makedirs(os.path.join(root, name))
+        with open(os.path.join(root, name, "movie.nfo"), "w") as f:
+            f.write("x" * size)
+
+
+LIBRARY = {
+    "Movie.2001.1080p.x264": 3000,
+    "Movie 2001 2160p HDR x265": 1000,
+    "Other.2002.720p": 10,
+    "Other.2002.1080p": 20,
+    "Unique.2003.1080p": 5,
+}
+
+
+@pytest.mark.parametrize("fmt", ["json", "ndjson"])
+def test_json_report_lists_scored_groups(fmt: str):
+    """Each duplicate group is written once, best directory first and recommended."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        _make_library(temp_dir, LIBRARY)
+        out = io.StringIO()
+        assert report_duplicates([temp_dir], fmt, jobs=2, out=out) == 2
+
+    text = out.getvalue()
+    groups = json.loads(text) if fmt == "json" else [json.loads(line) for line in text.splitlines()]
+    by_name = {group["group"]: group for group in groups}
+    assert set(by_name) == {"Movie 2001", "Other 2002"}
+
+    movie = by_name["Movie 2001"]
+    assert [d["name"] for d in movie["directories"]] == [
+        "Movie 2001 2160p HDR x265",
+        "Movie.2001.1080p.x264",
+    ]
+    assert movie["keep"] == movie["directories"][0]["path"]
+    assert movie["directories"][0]["tags"] == ["H265", "2160p", "HDR"]
+    assert [d["rank"] for d in movie["directories"]] == [1, 2]
+    assert movie["directories"][1]["delta"] == 0
+    assert movie["directories"][0]["delta"] > 0
+
+
+def test_csv_report_has_one_row_per_directory():
+    """CSV output has a header and marks exactly one keeper per group."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        _make_library(temp_dir, LIBRARY)
+        out = io.StringIO()
+        report_duplicates([temp_dir], "csv", jobs=2, out=out)
+
+    rows = list(csv.DictReader(io.StringIO(out.getvalue())))
+    assert len(rows) == 4
+    keepers = {row["group"]: row["name"] for row in rows if row["keep"] == "1"}
+    assert keepers == {"Movie 2001": "Movie 2001 2160p HDR x265", "Other 2002": "Other.2002.1080p"}
+
+
+def test_empty_json_report_is_valid():
+    """A library without duplicates still produces a valid (empty) JSON array."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        _make_library(temp_dir, {"Unique.2003.1080p": 5})
+        out = io.StringIO()
+        assert report_duplicates([temp_dir], "json", out=out) == 0
+    assert json.loads(out.getvalue()) == []
+
+
+def test_report_subtitles_are_plain_language_codes(monkeypatch: pytest.MonkeyPatch):
+    """External and embedded subtitle languages are reported as bare codes, even with colors on."""
+
+    def fake_parse(file_path: str) -> SimpleNamespace:
+        return SimpleNamespace(
+            tracks=[
+                SimpleNamespace(track_type="Video", codec_id="V_MPEGH/ISO/HEVC", format="HEVC"),
+                SimpleNamespace(track_type="Text", language="fi", format="PGS"),
+            ]
+        )
+
+    monkeypatch.setattr(media_probe.MediaInfo, "parse", fake_parse)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        _make_library(temp_dir, {"Movie.2001.1080p": 10, "Movie.2001.720p": 5})
+        movie_dir = os.path.join(temp_dir, "Movie.2001.1080p")
+        with open(os.path.join(movie_dir, "movie.mkv"), "wb") as f:
+            f.write(b"x" * 10)
+        with open(os.path.join(movie_dir, "movie.en.srt"), "w") as f:
+            f.write("1")
+        out = io.StringIO()
+        report_duplicates([temp_dir], "json", out=out)
+        csv_out = io.StringIO()
+        report_duplicates([temp_dir], "csv", out=csv_out)
+
+    [group] = json.loads(out.getvalue())
+    by_name = {d["name"]: d for d in group["directories"]}
+    assert by_name["Movie.2001.1080p"]["external_subtitles"] == ["EN"]
+    assert by_name["Movie.2001.1080p"]["embedded_subtitles"] == ["FI"]
+    assert by_name["Movie.2001.720p"]["external_subtitles"] == []
+    assert by_name["Movie.2001.720p"]["embedded_subtitles"] == []
+
+    rows = {row["name"]: row for row in csv.DictReader(io.StringIO(csv_out.getvalue()))}
+    assert rows["Movie.2001.1080p"]["external_subtitles"] == "EN"
+    assert rows["Movie.2001.1080p"]["embedded_subtitles"] == "FI"
+    assert "\033" not in out.getvalue() + csv_out.getvalue()
@@ -0,0 +1,54 @@
+"""Tests for directory scanning and content previews."""
+
+from __future__ import annotations
+
+import os
+import tempfile
+
+from tidyflix.core.models import DirectoryInfo
+from tidyflix.filesystem.scanner import (
+    get_directory_contents_cached,
+    get_directory_preview,
+    scan_directory_info,
+)
+
+
+def _touch(path: str):
+    with open(path, "w") as f:
+        f.write("x")
+
+
+def test_preview_lists_files_and_one_level_of_subdirectories():
+    """Files are capped at 10, subdirectories show a few entries and a remainder."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for i in range(12):
+            _touch(os.path.join(temp_dir, f"file{i:02d}.txt"))
+        subdir = os.path.join(temp_dir, "Subs")
+        os.makedirs(os.path.join(subdir, "Nested"))
+        for i in range(7):
+            _touch(os.path.join(subdir, f"sub{i}.srt"))
+
+        preview = get_directory_contents_cached(temp_dir)
+
+    assert preview[:10] == [("file", f"file{i:02d}.txt") for i in range(10)]
+    assert preview[10:] == [
+        ("summary", "[2 more files ...]"),
+        ("dir", "Subs"),
+        *[("subfile", f"sub{i}.srt") for i in range(5)],
+        ("subdir", "Nested"),
+    ]
+
+
+def test_scan_defers_preview_until_first_display():
+    """Scanning leaves the preview unbuilt; it is built once and then reused."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        movie = os.path.join(temp_dir, "Movie.2001")
+        os.makedirs(movie)
+        _touch(os.path.join(movie, "movie.nfo"))
+
+        dir_info = scan_directory_info(DirectoryInfo("Movie.2001", movie, temp_dir))
+        assert dir_info.contents is None
+
+        preview = get_directory_preview(dir_info)
+        assert preview == [("file", "movie.nfo")]
+        assert get_directory_preview(dir_info) is preview
@@ -0,0 +1,19 @@
+"""Tests for case-insensitive term lookup."""
+
+from __future__ import annotations
+
+from tidyflix.core.terms import TermIndex
+
+
+def test_lookup_and_contains_fold_case():
+    """Tokens match terms regardless of case, and the first of case variants wins."""
+    index = TermIndex([("BluRay", "BluRay"), ("HDR", "HDR"), ("bluray", "other")])
+
+    assert index.lookup("BLURAY") == "BluRay"
+    assert index.lookup("bluray") == "BluRay"
+    assert index.lookup("hdr") == "HDR"
+    assert index.lookup("HDR10") is None
+
+    assert "Hdr" in index
+    assert "bLuRaY" in index
+    assert "Blu" not in index
@@ -0,0 +1,91 @@
+"""Tests for trash directories and purging."""
+
+from __future__ import annotations
+
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import pytest
+
+from tidyflix.core.config import TRASH_DIR_NAME
+from tidyflix.core.library_index import LibraryIndex
+from tidyflix.filesystem.trash import list_trash, move_to_trash
+from tidyflix.operations.deletion import purge_trash
+
+
+def _make_movie(root: str, name: str):
+    os.makedirs(os.path.join(root, name))
+    with open(os.path.join(root, name, "movie.mkv"), "wb") as f:
+        f.write(b"\0" * 10)
+
+
+def test_move_to_trash_keeps_name_and_avoids_collisions():
+    """Trashed directories keep their name; a second one with the same name gets a suffix."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        _make_movie(temp_dir, "Movie.2001")
+        first = move_to_trash(os.path.join(temp_dir, "Movie.2001"))
+        _make_movie(temp_dir, "Movie.2001")
+        second = move_to_trash(os.path.join(temp_dir, "Movie.2001"))
+
+        trash_dir = os.path.join(temp_dir, TRASH_DIR_NAME)
+        assert first == os.path.join(trash_dir, "Movie.2001")
+        assert second == os.path.join(trash_dir, "Movie.2001.2")
+        assert list_trash(temp_dir) == [first, second]
+        assert os.listdir(temp_dir) == [TRASH_DIR_NAME]
+
+
+def test_move_to_trash_never_overwrites_concurrent_moves():
+    """Directories with the same name trashed at the same time all land under distinct names."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        sources: list[str] = []
+        for i in range(16):
+            parent = os.path.join(temp_dir, f"incoming{i}")
+            _make_movie(parent, "Movie.2001")
+            sources.append(os.path.join(parent, "Movie.2001"))
+        # Point every source at one shared trash directory to force name collisions
+        trash_dir = os.path.join(temp_dir, TRASH_DIR_NAME)
+        with mock.patch("tidyflix.filesystem.trash.get_trash_dir", return_value=trash_dir):
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                destinations = list(pool.map(move_to_trash, sources))
+
+        assert len(set(destinations)) == 16
+        assert all(os.listdir(destination) == ["movie.mkv"] for destination in destinations)
+
+
+def test_failed_move_to_trash_releases_reserved_name():
+    """A move that fails leaves no placeholder behind in the trash."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        with pytest.raises(OSError):
+            move_to_trash(os.path.join(temp_dir, "Missing.2001"))
+        assert list_trash(temp_dir) == []
+
+
+def test_trash_is_hidden_from_listings():
+    """Walks and subdirectory lists skip the trash directory."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        _make_movie(temp_dir, "Movie.2001")
+        _make_movie(temp_dir, "Other.2002")
+        move_to_trash(os.path.join(temp_dir, "Other.2002"))
+
+        index = LibraryIndex()
+        listing = index.listing(temp_dir)
+        assert listing is not None
+        assert listing.dirs == ["Movie.2001"]
+        walked = [root for root, _dirs, _files in index.walk(temp_dir)]
+        assert not any(TRASH_DIR_NAME in root for root in walked)
+
+
+def test_purge_empties_trash():
+    """Purging removes trashed directories and the trash directory itself."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        _make_movie(temp_dir, "Movie.2001")
+        _make_movie(temp_dir, "Movie.2001.720p")
+        move_to_trash(os.path.join(temp_dir, "Movie.2001.720p"))
+
+        assert purge_trash([temp_dir], dry_run=True)
+        assert len(list_trash(temp_dir)) == 1
+
+        assert purge_trash([temp_dir])
+        assert os.listdir(temp_dir) == ["Movie.2001"]
@@ -0,0 +1,27 @@
+"""Tests for shared utility functions."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from tidyflix.core.utils import get_directory_size, invalidate_directory_size
+
+
+def test_directory_size_is_memoized_until_invalidated(tmp_path: Path):
+    """Sizes are computed once per run and recomputed after invalidation."""
+    movie = tmp_path / "Movie.2020"
+    (movie / "extras").mkdir(parents=True)
+    (movie / "movie.mkv").write_bytes(b"x" * 100)
+    (movie / "extras" / "trailer.mkv").write_bytes(b"x" * 10)
+
+    assert get_directory_size(str(movie)) == 110
+    assert get_directory_size(str(tmp_path)) == 110
+
+    (movie / "extras" / "trailer.mkv").unlink()
+    # Still memoized: tidyflix did not make this change itself
+    assert get_directory_size(str(movie)) == 110
+
+    # Invalidating a subdirectory drops the sizes of all its ancestors too
+    invalidate_directory_size(str(movie / "extras"))
+    assert get_directory_size(str(movie)) == 100
+    assert get_directory_size(str(tmp_path)) == 100
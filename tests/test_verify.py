@@ -0,0 +1,51 @@
+"""Tests for directory verification."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from tidyflix.operations.verify import (
+    _classify_directory,  # pyright: ignore[reportPrivateUsage]
+    verify_directories_have_media,
+)
+
+
+def test_classify_directory(tmp_path: Path):
+    """Media, archive and empty status are reported from a single walk."""
+    (tmp_path / "Movie" / "Subs").mkdir(parents=True)
+    (tmp_path / "Movie" / "movie.mkv").write_bytes(b"x")
+    (tmp_path / "Movie" / "Subs" / "subs.rar").write_bytes(b"x")
+    (tmp_path / "Archived").mkdir()
+    (tmp_path / "Archived" / "movie.part01.rar").write_bytes(b"x")
+    (tmp_path / "Empty" / "Nested").mkdir(parents=True)
+    (tmp_path / "Junk").mkdir()
+    (tmp_path / "Junk" / "info.nfo").write_bytes(b"x")
+
+    movie = _classify_directory(str(tmp_path / "Movie"))
+    assert (movie.has_media, movie.has_archives, movie.is_empty) == (True, False, False)
+
+    archived = _classify_directory(str(tmp_path / "Archived"))
+    assert (archived.has_media, archived.has_archives, archived.is_empty) == (False, True, False)
+
+    empty = _classify_directory(str(tmp_path / "Empty"))
+    assert (empty.has_media, empty.has_archives, empty.is_empty) == (False, False, True)
+
+    junk = _classify_directory(str(tmp_path / "Junk"))
+    assert (junk.has_media, junk.has_archives, junk.is_empty) == (False, False, False)
+
+
+def test_verify_output_sorted_with_jobs(tmp_path: Path, capsys: pytest.CaptureFixture[str]):
+    """Parallel verification reports subdirectories in sorted order."""
+    names = [f"Movie.{i:02d}" for i in range(30)]
+    for i, name in enumerate(names):
+        (tmp_path / name).mkdir()
+        if i % 3:
+            (tmp_path / name / "movie.mkv").write_bytes(b"x")
+
+    assert not verify_directories_have_media([str(tmp_path)], jobs=8)
+
+    lines = [line for line in capsys.readouterr().out.splitlines() if "No media files" in line]
+    reported = [name for line in lines for name in names if f": {name}" in line]
+    assert reported == [name for i, name in enumerate(names) if i % 3 == 0]
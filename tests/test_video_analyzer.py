@@ -0,0 +1,85 @@
+"""Tests for video tag parsing and scoring."""
+
+from __future__ import annotations
+
+import pytest
+
+from tidyflix.analysis import video_analyzer
+from tidyflix.analysis.video_analyzer import (
+    calculate_relative_size_scores,
+    parse_video_tags_with_score,
+    scan_release_tags,
+    score_groups,
+)
+from tidyflix.core.models import DirectoryInfo
+
+
+def _tag_names(name: str) -> list[str]:
+    tags, _score = parse_video_tags_with_score(name)
+    return [tag.name for tag in tags]
+
+
+def test_delimited_tags_need_separators():
+    """AV1, 4K and 3D must be whole tokens; DV needs a separator on both sides."""
+    assert _tag_names("Movie.2020.AV1.4K.DV.3D") == ["AV1", "4K", "DV", "3D"]
+    assert _tag_names("AV1 Movie 4K") == ["AV1", "4K"]
+    assert _tag_names("Movie.2020.DV") == []
+    assert _tag_names("Movie.2020.4KUHD.av1x.3DS") == []
+    assert _tag_names("av1") == []
+
+
+def test_scan_release_tags_finds_overlapping_tags():
+    """Tags sharing characters are all found in one scan; precedence is applied later."""
+    assert scan_release_tags("Movie.2020.2160p.HDR10.x265.x264.IMAX-REPACK") == {
+        "2160p",
+        "HDR10",
+        "H265",
+        "H264",
+        "IMAX",
+        "REPACK",
+    }
+    assert scan_release_tags("Movie.hdr.hdr10") == {"HDR", "HDR10"}
+    assert _tag_names("Movie.2020.1080p.x265.x264.HDR.HDR10") == ["H265", "1080p", "HDR10"]
+
+
+def test_relative_size_scores_reuse_scanned_tag_score(monkeypatch: pytest.MonkeyPatch):
+    """Relative scoring is arithmetic over the scan results and can be repeated."""
+    directories: list[DirectoryInfo] = []
+    for name, tag_score, adjusted_size_mb in (("A", 50, 1000.0), ("B", 80, 500.0)):
+        dir_info = DirectoryInfo(name, f"/nonexistent/{name}", "/nonexistent")
+        dir_info.tag_score = tag_score
+        dir_info.video_score = tag_score
+        dir_info.adjusted_size_mb = adjusted_size_mb
+        directories.append(dir_info)
+
+    def fail(*_args: object, **_kwargs: object):
+        raise AssertionError("tags were parsed again")
+
+    monkeypatch.setattr(video_analyzer, "parse_video_tags_with_score", fail)
+    for _ in range(2):
+        calculate_relative_size_scores(directories, max_size_score=100)
+        assert [d.video_score for d in directories] == [150, 130]
+
+
+def test_score_groups_ranks_and_deltas():
+    """Batch scoring ranks best first, keeps ties in order and measures from the lowest."""
+    groups: list[list[DirectoryInfo]] = []
+    for sizes_and_tags in (
+        [(1000.0, 10), (500.0, 60), (None, 5)],
+        [(200.0, 0), (200.0, 0)],
+    ):
+        group: list[DirectoryInfo] = []
+        for i, (adjusted_size_mb, tag_score) in enumerate(sizes_and_tags):
+            dir_info = DirectoryInfo(f"D{i}", f"/nonexistent/D{i}", "/nonexistent")
+            dir_info.adjusted_size_mb = adjusted_size_mb
+            dir_info.tag_score = tag_score
+            group.append(dir_info)
+        groups.append(group)
+
+    first, second = score_groups(groups, max_size_score=100)
+    assert first.scores == [110, 110, 5]
+    assert first.deltas == [105, 105, 0]
+    assert first.ranking == [0, 1, 2]
+    assert second.scores == [100, 100]
+    assert second.deltas == [0, 0]
+    assert all(d.video_score is None for group in groups for d in group)